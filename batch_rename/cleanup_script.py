@@ -4,34 +4,36 @@ Quick cleanup script to fix the broken syntax from the previous script.
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Candidate lines contain an assignment whose right-hand side was commented out
+_CANDIDATE_LINE_RE = re.compile(r'^.*= #.*$', re.MULTILINE)
+_BROKEN_ASSIGNMENT_RE = re.compile(r'(\s*)(.+?)\s*=\s*#\s*(processor\.\w+\(.+?)\s*#\s*TODO.*')
+
+def _fix_broken_line(match):
+    """Rewrite a single candidate line, leaving unrelated lines untouched."""
+    line = match.group(0)
+    if 'processor.' not in line or 'TODO' not in line:
+        return line
+    
+    # Extract the original assignment
+    assignment = _BROKEN_ASSIGNMENT_RE.search(line)
+    if assignment:
+        indent, var_name, method_call = assignment.groups()
+        # Reconstruct as commented line
+        return f"{indent}# {var_name} = {method_call}  # TODO: Replace with actual method"
+    
+    # If we can't parse it, just comment the whole line
+    return '        # ' + line.strip() + '  # FIXME: Broken by script'
+
 def cleanup_broken_syntax(content):
     """Fix broken syntax caused by bad regex replacements."""
     
     # Fix broken lines like: result = # processor.analyze( # TODO...config)
     # These should be: # result = processor.analyze(config)  # TODO...
-    
-    lines = content.split('\n')
-    fixed_lines = []
-    
-    for line in lines:
-        # Look for broken patterns
-        if '= #' in line and 'processor.' in line and 'TODO' in line:
-            # Extract the original assignment
-            match = re.search(r'(\s*)(.+?)\s*=\s*#\s*(processor\.\w+\(.+?)\s*#\s*TODO.*', line)
-            if match:
-                indent, var_name, method_call = match.groups()
-                # Reconstruct as commented line
-                fixed_line = f"{indent}# {var_name} = {method_call}  # TODO: Replace with actual method"
-                fixed_lines.append(fixed_line)
-            else:
-                # If we can't parse it, just comment the whole line
-                fixed_lines.append('        # ' + line.strip() + '  # FIXME: Broken by script')
-        else:
-            fixed_lines.append(line)
-    
-    return '\n'.join(fixed_lines)
+    # A single multiline scan finds the candidate lines without splitting the file
+    return _CANDIDATE_LINE_RE.sub(_fix_broken_line, content)
 
 def fix_file(file_path):
     """Fix a single test file."""
@@ -42,7 +44,13 @@ def fix_file(file_path):
             content = f.read()
         
         # Apply cleanup
-        content = cleanup_broken_syntax(content)
+        cleaned = cleanup_broken_syntax(content)
+        
+        # Nothing to fix, leave the file untouched
+        if cleaned == content:
+            print(f"✅ {file_path} already clean (unchanged)")
+            return True
+        content = cleaned
         
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(content)
@@ -68,12 +76,17 @@ def main():
         "test_integration.py"
     ]
     
+    existing_files = []
     for test_file in test_files:
         file_path = test_dir / test_file
         if file_path.exists():
-            fix_file(file_path)
+            existing_files.append(file_path)
         else:
             print(f"⚠️  {file_path} not found, skipping")
+    
+    # Files are independent, so overlap their reads and writes
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(fix_file, existing_files))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
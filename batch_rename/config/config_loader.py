@@ -4,13 +4,98 @@ Configuration file loader for batch rename operations.
 Handles loading and parsing YAML/JSON configuration files into RenameConfig objects.
 """
 
+import copy
+import functools
 import json
-import yaml
+import os
 from pathlib import Path
 from typing import Dict, Any, Union
 
 from ..core.config import RenameConfig
 
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# PyYAML is imported on first YAML load so JSON-only runs skip its import cost
+_yaml = None
+_YamlLoader = None
+
+
+def _import_yaml():
+    """Import PyYAML once, preferring the libyaml-backed loader when available."""
+    global _yaml, _YamlLoader
+    if _yaml is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeLoader as loader
+        _YamlLoader = loader
+        _yaml = yaml
+    return _yaml
+
+# CLI overrides applied to RenameConfig: (cli key, config attribute, only apply truthy values)
+_CLI_OVERRIDES = (
+    ('input_folder', 'input_folder', True),
+    ('recursive', 'recursive', False),
+    ('preview_mode', 'preview_mode', False),
+    ('workers', 'workers', True),
+)
+
+
+def _parse_workers(value: Any) -> Any:
+    """Coerce a numeric-string workers setting to int; RenameConfig validates the result."""
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            raise ValueError(f"settings.workers must be an integer >= 1, got {value!r}") from None
+    return value
+
+
+@functools.lru_cache(maxsize=64)
+def _load_raw(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Read and parse a configuration file.
+    
+    mtime_ns and size are not used directly; they are part of the cache key
+    so that an edited file is parsed again instead of served from the cache.
+    """
+    suffix = os.path.splitext(path_str)[1]
+    ext = suffix.lower()
+    
+    # Both parsers decode bytes themselves, so skip the text-mode decoding layer
+    with open(path_str, 'rb') as f:
+        data = f.read()
+    
+    if ext == '.json':
+        return _json_loads(data)
+    elif ext in ('.yml', '.yaml'):
+        yaml = _import_yaml()
+        return yaml.load(data, Loader=_YamlLoader)
+    else:
+        raise ValueError(f"Unsupported config file format: {suffix}")
+
+
+def _build_filter_config(filter_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a filter entry from a config file into RenameConfig filter format."""
+    # Handle filter inversion (names starting with !)
+    filter_name = filter_config.get('name', '')
+    inverted = filter_name.startswith('!')
+    if inverted:
+        filter_name = filter_name[1:]  # Remove ! prefix
+    
+    return {
+        'name': filter_name,
+        'positional': filter_config.get('args', []),
+        'keyword': filter_config.get('kwargs', {}),
+        'inverted': inverted
+    }
+
 
 class ConfigLoader:
     """Loads configuration files and converts them to RenameConfig objects."""
@@ -31,25 +116,31 @@ class ConfigLoader:
             ValueError: If file format is unsupported or contains invalid data
         """
         path = Path(config_path)
+        path_str = os.path.abspath(path)
         
-        if not path.exists():
+        # A single stat serves as both the existence check and the cache key
+        try:
+            stat = os.stat(path_str)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {path}")
         
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                if path.suffix.lower() == '.json':
-                    return json.load(f)
-                elif path.suffix.lower() in ['.yml', '.yaml']:
-                    return yaml.safe_load(f)
-                else:
-                    raise ValueError(f"Unsupported config file format: {path.suffix}")
-        
+            # Parsed data is cached per file version; hand out a copy so callers can mutate it
+            config_data = _load_raw(path_str, stat.st_mtime_ns, stat.st_size)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file {path}: {e}")
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML in config file {path}: {e}")
         except Exception as e:
+            # YAMLError is only reachable once PyYAML has been imported
+            if _yaml is not None and isinstance(e, _yaml.YAMLError):
+                raise ValueError(f"Invalid YAML in config file {path}: {e}")
             raise ValueError(f"Error reading config file {path}: {e}")
+        
+        return copy.deepcopy(config_data)
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Discard all cached configuration file contents."""
+        _load_raw.cache_clear()
     
     @staticmethod
     def config_to_rename_config(config_data: Dict[str, Any], 
@@ -78,13 +169,14 @@ class ConfigLoader:
         }
         
         # Build converters list
-        converters = []
-        for conv_config in pipeline.get('converters', []):
-            converters.append({
+        converters = [
+            {
                 'name': conv_config.get('name'),
                 'positional': conv_config.get('args', []),
                 'keyword': conv_config.get('kwargs', {})
-            })
+            }
+            for conv_config in pipeline.get('converters', ())
+        ]
         
         # Build template configuration
         template = None
@@ -97,20 +189,7 @@ class ConfigLoader:
             }
         
         # Build filters list
-        filters = []
-        for filter_config in pipeline.get('filters', []):
-            # Handle filter inversion (names starting with !)
-            filter_name = filter_config.get('name', '')
-            inverted = filter_name.startswith('!')
-            if inverted:
-                filter_name = filter_name[1:]  # Remove ! prefix
-            
-            filters.append({
-                'name': filter_name,
-                'positional': filter_config.get('args', []),
-                'keyword': filter_config.get('kwargs', {}),
-                'inverted': inverted
-            })
+        filters = [_build_filter_config(filter_config) for filter_config in pipeline.get('filters', ())]
         
         # Create base configuration from config file
         config = RenameConfig(
@@ -122,21 +201,24 @@ class ConfigLoader:
             filters=filters,
             recursive=settings.get('recursive', False),
             preview_mode=settings.get('preview_mode', True),
+            workers=_parse_workers(settings.get('workers', 1)),
             on_existing_collision=collision_handling.get('on_existing_collision', 'skip'),
             on_internal_collision=collision_handling.get('on_internal_collision', 'skip')
         )
         
         # Apply CLI overrides if provided
-        if cli_overrides:
-            # Override specific fields if provided in CLI
-            if 'input_folder' in cli_overrides and cli_overrides['input_folder']:
-                config.input_folder = cli_overrides['input_folder']
-            if 'recursive' in cli_overrides:
-                config.recursive = cli_overrides['recursive']
-            if 'preview_mode' in cli_overrides:
-                config.preview_mode = cli_overrides['preview_mode']
-            if 'execute' in cli_overrides and cli_overrides['execute']:
-                config.preview_mode = False
+        if not cli_overrides:
+            return config
+        
+        for cli_key, attr_name, truthy_only in _CLI_OVERRIDES:
+            if cli_key in cli_overrides:
+                value = cli_overrides[cli_key]
+                if value or not truthy_only:
+                    setattr(config, attr_name, value)
+        
+        # --execute always wins over preview mode
+        if cli_overrides.get('execute'):
+            config.preview_mode = False
         
         return config
     
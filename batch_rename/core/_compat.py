@@ -0,0 +1,10 @@
+"""
+Python version compatibility helpers for the core package.
+"""
+
+import sys
+
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+);
+# use as @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
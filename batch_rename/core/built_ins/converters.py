@@ -2,16 +2,85 @@
 Built-in converters for transforming extracted data fields.
 
 Converters take a ProcessingContext (with extracted_data) and return Dict[str, Any] with transformed data.
-All converters preserve field structure - same keys in and out.
+All converters preserve field structure - same keys in and out. When a converter
+leaves its field unchanged it returns the input dict instead of a copy.
 """
 
+import functools
+import re
+import sys
+import types
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable
 from datetime import datetime
 
 from ..processing_context import ProcessingContext
 
 
+def _intern_field(field: Any) -> Any:
+    """Intern string field names so lookups against interned extractor keys compare by identity."""
+    return sys.intern(field) if isinstance(field, str) else field
+
+
+# Numeric strptime directives: (datetime argument, pattern used by strptime itself)
+_NUMERIC_DIRECTIVES = {
+    'Y': ('year', r'\d\d\d\d'),
+    'm': ('month', r'1[0-2]|0[1-9]|[1-9]'),
+    'd': ('day', r'3[01]|[12]\d|0[1-9]|[1-9]| [1-9]'),
+    'H': ('hour', r'2[0-3]|[0-1]\d|\d'),
+    'M': ('minute', r'[0-5]\d|\d'),
+    'S': ('second', r'6[0-1]|[0-5]\d|\d'),
+}
+_DIRECTIVE_SPLIT_RE = re.compile(r'(%.)')
+_DIGITS_RE = re.compile(r'\d+')
+
+# Case types supported by the case converter
+_CASE_OPS = {
+    'upper': str.upper,
+    'lower': str.lower,
+    'title': str.title,
+    'capitalize': str.capitalize,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _compiled_strptime(fmt: str) -> Callable[[str], datetime]:
+    """
+    Return a parser equivalent to datetime.strptime for a fixed format.
+    
+    Formats made only of numeric directives (%Y %m %d %H %M %S) and literal
+    text are compiled once into a regex that builds the datetime directly.
+    Like strptime, literal text matches case-insensitively. Anything else
+    falls back to datetime.strptime.
+    """
+    regex_parts = []
+    seen = set()
+    for token in _DIRECTIVE_SPLIT_RE.split(fmt):
+        if token.startswith('%') and len(token) == 2:
+            directive = _NUMERIC_DIRECTIVES.get(token[1])
+            if directive is None or directive[0] in seen:
+                return lambda value: datetime.strptime(value, fmt)
+            seen.add(directive[0])
+            regex_parts.append(f'(?P<{directive[0]}>{directive[1]})')
+        elif token:
+            if '%' in token or any(char.isspace() for char in token):
+                # strptime treats whitespace loosely; leave those formats to it
+                return lambda value: datetime.strptime(value, fmt)
+            regex_parts.append(re.escape(token))
+    
+    pattern = re.compile(''.join(regex_parts), re.IGNORECASE)
+    
+    def parse(value: str) -> datetime:
+        match = pattern.fullmatch(value)
+        if match is None:
+            raise ValueError(f"time data {value!r} does not match format {fmt!r}")
+        fields = {'year': 1900, 'month': 1, 'day': 1}
+        fields.update((name, int(number)) for name, number in match.groupdict().items())
+        return datetime(**fields)
+    
+    return parse
+
+
 def pad_numbers_converter(context: ProcessingContext, positional_args: List[str], **kwargs) -> Dict[str, Any]:
     """
     Pad numeric fields with leading zeros.
@@ -19,9 +88,12 @@ def pad_numbers_converter(context: ProcessingContext, positional_args: List[str]
     Positional args: [field_name, width]
     Keyword args: field=field_name, width=width
     
+    Only the first run of digits in the value is padded.
+    
     Examples:
         pad_numbers,sequence,3  → "5" becomes "005"
         pad_numbers,field=id,width=4  → "42" becomes "0042"
+        pad_numbers,version,2  → "v1.2" becomes "v01.2"
     
     Returns:
         Dict with the specified field zero-padded
@@ -37,26 +109,27 @@ def pad_numbers_converter(context: ProcessingContext, positional_args: List[str]
     
     if not field:
         raise ValueError("pad_numbers converter requires field name")
+    field = _intern_field(field)
+    
+    data = context.extracted_data
+    if not data:
+        return data or {}
     
-    if not context.has_extracted_data():
-        return context.extracted_data or {}
-    
-    result = context.extracted_data.copy()
-    
-    if field in result and result[field]:
-        # Extract numeric part and pad
-        value = str(result[field])
-        # Try to extract just the numbers
-        numeric_part = ''.join(filter(str.isdigit, value))
-        if numeric_part:
-            padded = numeric_part.zfill(width)
-            # Replace the numeric part in the original value
-            result[field] = value.replace(numeric_part, padded, 1)
-    elif field not in result:
-        available_fields = list(result.keys())
+    if field not in data:
+        available_fields = list(data.keys())
         raise ValueError(f"Field '{field}' not found. Available fields: {available_fields}")
     
-    return result
+    if not data[field]:
+        return data
+    
+    # Find the first run of digits and pad it in place
+    value = str(data[field])
+    match = _DIGITS_RE.search(value)
+    if not match:
+        return data
+    
+    padded = match.group(0).zfill(width)
+    return {**data, field: value[:match.start()] + padded + value[match.end():]}
 
 
 def date_format_converter(context: ProcessingContext, positional_args: List[str], **kwargs) -> Dict[str, Any]:
@@ -86,26 +159,27 @@ def date_format_converter(context: ProcessingContext, positional_args: List[str]
     
     if not field:
         raise ValueError("date_format converter requires field name")
+    field = _intern_field(field)
     
-    if not context.has_extracted_data():
-        return context.extracted_data or {}
-    
-    result = context.extracted_data.copy()
-    
-    if field in result and result[field]:
-        try:
-            # Parse the date with input format
-            date_obj = datetime.strptime(str(result[field]), input_fmt)
-            # Format with output format
-            result[field] = date_obj.strftime(output_fmt)
-        except ValueError as e:
-            # If date parsing fails, keep original value
-            pass
-    elif field not in result:
-        available_fields = list(result.keys())
+    data = context.extracted_data
+    if not data:
+        return data or {}
+    
+    if field not in data:
+        available_fields = list(data.keys())
         raise ValueError(f"Field '{field}' not found. Available fields: {available_fields}")
     
-    return result
+    if not data[field]:
+        return data
+    
+    try:
+        # Parse the date with input format
+        date_obj = _compiled_strptime(input_fmt)(str(data[field]))
+        # Format with output format
+        return {**data, field: date_obj.strftime(output_fmt)}
+    except ValueError:
+        # If date parsing fails, keep original value
+        return data
 
 
 def case_converter(context: ProcessingContext, positional_args: List[str], **kwargs) -> Dict[str, Any]:
@@ -134,35 +208,32 @@ def case_converter(context: ProcessingContext, positional_args: List[str], **kwa
     
     if not field:
         raise ValueError("case converter requires field name")
+    field = _intern_field(field)
     
-    if case_type not in ['upper', 'lower', 'title', 'capitalize']:
+    case_op = _CASE_OPS.get(case_type)
+    if case_op is None:
         raise ValueError(f"Invalid case type '{case_type}'. Must be: upper, lower, title, capitalize")
     
-    if not context.has_extracted_data():
-        return context.extracted_data or {}
-    
-    result = context.extracted_data.copy()
-    
-    if field in result and result[field]:
-        value = str(result[field])
-        if case_type == 'upper':
-            result[field] = value.upper()
-        elif case_type == 'lower':
-            result[field] = value.lower()
-        elif case_type == 'title':
-            result[field] = value.title()
-        elif case_type == 'capitalize':
-            result[field] = value.capitalize()
-    elif field not in result:
-        available_fields = list(result.keys())
+    data = context.extracted_data
+    if not data:
+        return data or {}
+    
+    if field not in data:
+        available_fields = list(data.keys())
         raise ValueError(f"Field '{field}' not found. Available fields: {available_fields}")
     
-    return result
+    if not data[field]:
+        return data
+    
+    return {**data, field: case_op(str(data[field]))}
 
 
 # Registry of built-in converters
-BUILTIN_CONVERTERS = {
+_BUILTIN_CONVERTERS_IMPL = {
     'pad_numbers': pad_numbers_converter,
     'date_format': date_format_converter,
     'case': case_converter,
-}
\ No newline at end of file
+}
+
+# Read-only view of the registry
+BUILTIN_CONVERTERS = types.MappingProxyType(_BUILTIN_CONVERTERS_IMPL)
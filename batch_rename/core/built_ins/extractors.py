@@ -4,14 +4,23 @@ Built-in extractors for parsing data from filenames and metadata.
 Extractors take a ProcessingContext and return Dict[str, Any] with extracted field data.
 """
 
+import functools
 import re
+import sys
+import types
 from pathlib import Path
-from typing import Dict, Any, List
-from datetime import datetime
+from typing import Dict, Any, List, Callable
+from datetime import date, datetime
 
 from ..processing_context import ProcessingContext
 
 
+@functools.lru_cache(maxsize=256)
+def _compiled(pattern: str) -> re.Pattern:
+    """Compile a regex pattern once and reuse it across files."""
+    return re.compile(pattern)
+
+
 def split_extractor(context: ProcessingContext, positional_args: List[str], **kwargs) -> Dict[str, Any]:
     """
     Split filename by delimiter and assign field names.
@@ -43,27 +52,35 @@ def split_extractor(context: ProcessingContext, positional_args: List[str], **kw
         - Extra filename parts beyond field names are ignored
         - Missing parts result in empty string values
     """
+    return build_split_extractor(positional_args, kwargs)(context)
+
+
+def build_split_extractor(positional_args: List[str], kwargs: Dict[str, Any]) -> Callable[[ProcessingContext], Dict[str, Any]]:
+    """Create a split extractor with its delimiter and field names resolved up front."""
     if not positional_args:
         raise ValueError("split extractor requires delimiter and field names")
     
     delimiter = positional_args[0]
-    field_names = positional_args[1:]
+    # Interned keys let converters find fields by identity instead of string comparison
+    field_names = [sys.intern(name) if isinstance(name, str) else name for name in positional_args[1:]]
     
     if not field_names:
         raise ValueError("split extractor requires at least one field name")
     
-    # Split the base filename (without extension)
-    filename_parts = context.base_name.split(delimiter)
+    field_count = len(field_names)
+    missing_parts = [""] * field_count  # Empty string for missing parts
     
-    # Create result dict with field mappings
-    result = {}
-    for i, field_name in enumerate(field_names):
-        if i < len(filename_parts):
-            result[field_name] = filename_parts[i]
-        else:
-            result[field_name] = ""  # Empty string for missing parts
+    def split_fields(context: ProcessingContext) -> Dict[str, Any]:
+        # Split the base filename (without extension), stopping once every
+        # field has a part; any unsplit remainder is past the last field
+        filename_parts = context.base_name.split(delimiter, field_count)
+        if len(filename_parts) < field_count:
+            filename_parts += missing_parts[len(filename_parts):]
+        
+        # Create result dict with field mappings
+        return dict(zip(field_names, filename_parts))
     
-    return result
+    return split_fields
 
 
 def regex_extractor(context: ProcessingContext, positional_args: List[str], **kwargs) -> Dict[str, Any]:
@@ -80,6 +97,11 @@ def regex_extractor(context: ProcessingContext, positional_args: List[str], **kw
     Returns:
         Dict with named group matches or mapped numbered groups
     """
+    return build_regex_extractor(positional_args, kwargs)(context)
+
+
+def build_regex_extractor(positional_args: List[str], kwargs: Dict[str, Any]) -> Callable[[ProcessingContext], Dict[str, Any]]:
+    """Create a regex extractor with its pattern compiled and group mapping resolved up front."""
     # Get pattern from positional or keyword args
     if positional_args:
         pattern = positional_args[0]
@@ -90,29 +112,32 @@ def regex_extractor(context: ProcessingContext, positional_args: List[str], **kw
         raise ValueError("regex extractor requires pattern")
     
     try:
-        match = re.search(pattern, context.base_name)
+        compiled = _compiled(pattern)
+    except re.error as e:
+        raise ValueError(f"Invalid regex pattern: {e}")
+    
+    # Map numbered groups to field names using fieldN=name kwargs
+    group_fields = [
+        (i, kwargs[f'field{i + 1}'])
+        for i in range(compiled.groups)
+        if f'field{i + 1}' in kwargs
+    ]
+    
+    def regex_fields(context: ProcessingContext) -> Dict[str, Any]:
+        match = compiled.search(context.base_name)
         if not match:
             return {}  # No matches found
-            
+        
         # Check if pattern uses named groups
-        if match.groupdict():
-            return match.groupdict()
+        named_groups = match.groupdict()
+        if named_groups:
+            return named_groups
         
         # Handle numbered groups with field mapping
-        result = {}
         groups = match.groups()
-        
-        # Map numbered groups to field names using fieldN=name kwargs
-        for i, group_value in enumerate(groups, 1):
-            field_key = f'field{i}'
-            if field_key in kwargs:
-                field_name = kwargs[field_key]
-                result[field_name] = group_value
-        
-        return result
-        
-    except re.error as e:
-        raise ValueError(f"Invalid regex pattern: {e}")
+        return {field_name: groups[i] for i, field_name in group_fields}
+    
+    return regex_fields
 
 
 def position_extractor(context: ProcessingContext, positional_args: List[str], **kwargs) -> Dict[str, Any]:
@@ -129,43 +154,45 @@ def position_extractor(context: ProcessingContext, positional_args: List[str], *
     Returns:
         Dict with field data extracted from character positions
     """
+    return build_position_extractor(positional_args, kwargs)(context)
+
+
+def build_position_extractor(positional_args: List[str], kwargs: Dict[str, Any]) -> Callable[[ProcessingContext], Dict[str, Any]]:
+    """Create a position extractor with its position specs parsed up front."""
     if not positional_args:
         raise ValueError("position extractor requires position specifications")
     
-    result = {}
-    filename = context.base_name
-    
     # Handle comma-separated specs in single argument or multiple arguments
     if len(positional_args) == 1 and ',' in positional_args[0]:
         specs = [spec.strip() for spec in positional_args[0].split(',')]
     else:
         specs = positional_args
     
+    # Parsed specs as (slice, field name); slicing past the end yields ""
+    parsed_specs = []
     for spec in specs:
-        if ':' not in spec:
+        pos_part, sep, field_name = spec.partition(':')
+        if not sep:
             raise ValueError(f"Invalid position spec '{spec}'. Format: 'start-end:fieldname' or 'start:fieldname'")
         
-        pos_part, field_name = spec.split(':', 1)
-        
         try:
-            if '-' in pos_part:
+            start_s, sep, end_s = pos_part.partition('-')
+            if sep:
                 # Range: "0-2" (inclusive end)
-                start, end = map(int, pos_part.split('-', 1))
-                if start < len(filename):
-                    result[field_name] = filename[start:end+1]
-                else:
-                    result[field_name] = ""
+                start, end = int(start_s), int(end_s)
+                parsed_specs.append((slice(start, end + 1), field_name))
             else:
                 # Single position: "0"
                 pos = int(pos_part)
-                if pos < len(filename):
-                    result[field_name] = filename[pos]
-                else:
-                    result[field_name] = ""
+                parsed_specs.append((slice(pos, pos + 1), field_name))
         except ValueError as e:
             raise ValueError(f"Invalid position specification '{pos_part}': {e}")
     
-    return result
+    def position_fields(context: ProcessingContext) -> Dict[str, Any]:
+        filename = context.base_name
+        return {field_name: filename[position] for position, field_name in parsed_specs}
+    
+    return position_fields
 
 
 def metadata_extractor(context: ProcessingContext, positional_args: List[str], **kwargs) -> Dict[str, Any]:
@@ -181,6 +208,11 @@ def metadata_extractor(context: ProcessingContext, positional_args: List[str], *
     Returns:
         Dict with requested metadata fields
     """
+    return build_metadata_extractor(positional_args, kwargs)(context)
+
+
+def build_metadata_extractor(positional_args: List[str], kwargs: Dict[str, Any]) -> Callable[[ProcessingContext], Dict[str, Any]]:
+    """Create a metadata extractor with its requested fields validated up front."""
     available_fields = ['created', 'modified', 'size']
     
     if not positional_args:
@@ -189,50 +221,64 @@ def metadata_extractor(context: ProcessingContext, positional_args: List[str], *
     else:
         requested_fields = positional_args
     
-    result = {}
-    
     for field in requested_fields:
         if field not in available_fields:
             raise ValueError(f"Unknown metadata field '{field}'. Available: {', '.join(available_fields)}")
+    
+    def metadata_fields(context: ProcessingContext) -> Dict[str, Any]:
+        result = {}
         
-        # Handle timestamp fields - check for both 'created'/'modified' and 'created_timestamp'/'modified_timestamp'
-        if field in ['created', 'modified']:
-            timestamp_key = f'{field}_timestamp'
-            if timestamp_key in context.metadata:
-                timestamp = context.metadata[timestamp_key]
-                if isinstance(timestamp, (int, float)):
-                    # Convert Unix timestamp to datetime
-                    dt = datetime.fromtimestamp(timestamp)
-                    result[field] = dt.strftime('%Y-%m-%d')
+        for field in requested_fields:
+            # Handle timestamp fields - check for both 'created'/'modified' and 'created_timestamp'/'modified_timestamp'
+            if field in ['created', 'modified']:
+                timestamp_key = f'{field}_timestamp'
+                if timestamp_key in context.metadata:
+                    timestamp = context.metadata[timestamp_key]
+                    if isinstance(timestamp, (int, float)):
+                        # Local calendar date as YYYY-MM-DD; isoformat avoids strftime's overhead
+                        result[field] = date.fromtimestamp(timestamp).isoformat()
+                    else:
+                        result[field] = str(timestamp)
+                elif field in context.metadata:
+                    timestamp = context.metadata[field]
+                    if isinstance(timestamp, datetime):
+                        result[field] = timestamp.strftime('%Y-%m-%d')
+                    else:
+                        result[field] = str(timestamp)
                 else:
-                    result[field] = str(timestamp)
+                    result[field] = ''
             elif field in context.metadata:
-                timestamp = context.metadata[field]
-                if isinstance(timestamp, datetime):
-                    result[field] = timestamp.strftime('%Y-%m-%d')
+                # Handle other fields like 'size'
+                if field == 'size':
+                    # Format size as KB
+                    size_bytes = context.metadata[field]
+                    result[field] = str(size_bytes // 1024) if size_bytes >= 1024 else '0'
                 else:
-                    result[field] = str(timestamp)
+                    result[field] = str(context.metadata[field])
             else:
+                # Default empty value when metadata not available
                 result[field] = ''
-        elif field in context.metadata:
-            # Handle other fields like 'size'
-            if field == 'size':
-                # Format size as KB
-                size_bytes = context.metadata[field]
-                result[field] = str(size_bytes // 1024) if size_bytes >= 1024 else '0'
-            else:
-                result[field] = str(context.metadata[field])
-        else:
-            # Default empty value when metadata not available
-            result[field] = ''
+        
+        return result
     
-    return result
+    return metadata_fields
 
 
 # Registry of built-in extractor functions
-BUILTIN_EXTRACTORS = {
+_BUILTIN_EXTRACTORS_IMPL = {
     'split': split_extractor,
     'regex': regex_extractor,
     'position': position_extractor,
     'metadata': metadata_extractor,
-}
\ No newline at end of file
+}
+
+# Read-only view of the registry
+BUILTIN_EXTRACTORS = types.MappingProxyType(_BUILTIN_EXTRACTORS_IMPL)
+
+# Factories that parse extractor arguments once and return per-file callables
+BUILTIN_EXTRACTOR_FACTORIES = {
+    'split': build_split_extractor,
+    'regex': build_regex_extractor,
+    'position': build_position_extractor,
+    'metadata': build_metadata_extractor,
+}
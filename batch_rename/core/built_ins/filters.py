@@ -6,13 +6,62 @@ All filters take a ProcessingContext and return boolean values.
 """
 
 import fnmatch
+import functools
 import datetime
+import operator
+import os
+import re
+import types
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable
 
 from ..processing_context import ProcessingContext
 
 
+# Timestamp comparisons for date-modified operators ('==' compares calendar days)
+_DATE_COMPARISONS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+}
+
+# Same field patterns strptime uses for %Y, %m and %d
+_ISO_DATE_RE = re.compile(r'(\d\d\d\d)-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> Callable[[str], Any]:
+    """
+    Build a matcher for a glob pattern with fnmatch semantics.
+    
+    Patterns whose only wildcards are a leading and/or trailing '*' (such as
+    "*.pdf", "report*" or "*backup*") become plain string checks; everything
+    else is translated to a compiled regex.
+    """
+    pattern = os.path.normcase(pattern)
+    
+    if '?' not in pattern and '[' not in pattern:
+        literal = pattern.strip('*')
+        if '*' not in literal:
+            starts_wild = pattern.startswith('*')
+            ends_wild = pattern.endswith('*')
+            if starts_wild and ends_wild:
+                return lambda name: literal in name
+            if starts_wild:
+                return lambda name: name.endswith(literal)
+            if ends_wild:
+                return lambda name: name.startswith(literal)
+            return lambda name: name == literal
+    
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _accept_all(context: ProcessingContext) -> bool:
+    """Filter that keeps every file."""
+    return True
+
+
 def pattern_filter(context: ProcessingContext, positional_args: List[str], **kwargs) -> bool:
     """
     Filter files based on glob patterns.
@@ -28,8 +77,11 @@ def pattern_filter(context: ProcessingContext, positional_args: List[str], **kwa
     Returns:
         True if file should be processed, False otherwise
     """
-    filename = context.filename
-    
+    return build_pattern_filter(positional_args, kwargs)(context)
+
+
+def build_pattern_filter(positional_args: List[str], kwargs: Dict[str, Any]) -> Callable[[ProcessingContext], bool]:
+    """Create a pattern filter with its glob patterns compiled up front."""
     # Handle positional arguments
     if positional_args:
         include_pattern = positional_args[0] if len(positional_args) > 0 else None
@@ -38,15 +90,24 @@ def pattern_filter(context: ProcessingContext, positional_args: List[str], **kwa
         include_pattern = kwargs.get('include')
         exclude_pattern = kwargs.get('exclude')
     
-    # Check include pattern
-    if include_pattern and not fnmatch.fnmatch(filename, include_pattern):
-        return False
+    include_match = _compile_glob(include_pattern) if include_pattern else None
+    exclude_match = _compile_glob(exclude_pattern) if exclude_pattern else None
     
-    # Check exclude pattern
-    if exclude_pattern and fnmatch.fnmatch(filename, exclude_pattern):
-        return False
+    def pattern_check(context: ProcessingContext) -> bool:
+        # Match case-normalized names exactly like fnmatch.fnmatch does
+        filename = os.path.normcase(context.filename)
+        
+        # Check include pattern
+        if include_match and not include_match(filename):
+            return False
+        
+        # Check exclude pattern
+        if exclude_match and exclude_match(filename):
+            return False
+        
+        return True
     
-    return True
+    return pattern_check
 
 
 def file_type_filter(context: ProcessingContext, positional_args: List[str], **kwargs) -> bool:
@@ -64,6 +125,11 @@ def file_type_filter(context: ProcessingContext, positional_args: List[str], **k
     Returns:
         True if file extension matches any allowed type
     """
+    return build_file_type_filter(positional_args, kwargs)(context)
+
+
+def build_file_type_filter(positional_args: List[str], kwargs: Dict[str, Any]) -> Callable[[ProcessingContext], bool]:
+    """Create a file type filter with its allowed extensions normalized up front."""
     # Handle positional arguments
     if positional_args:
         if len(positional_args) == 1 and ',' in positional_args[0]:
@@ -76,14 +142,19 @@ def file_type_filter(context: ProcessingContext, positional_args: List[str], **k
         # Handle keyword arguments
         types_str = kwargs.get('types', '')
         if not types_str:
-            return True
+            return _accept_all
         allowed_types = [ext.strip().lower().lstrip('.') for ext in types_str.split(',')]
     
     if not allowed_types:
-        return True
-        
-    file_ext = context.extension.lower().lstrip('.')
-    return file_ext in allowed_types
+        return _accept_all
+    
+    allowed_types = frozenset(allowed_types)
+    
+    def file_type_check(context: ProcessingContext) -> bool:
+        # Path.suffix is either empty or starts with a single '.'
+        return context.extension[1:].lower() in allowed_types
+    
+    return file_type_check
 
 
 def file_size_filter(context: ProcessingContext, positional_args: List[str], **kwargs) -> bool:
@@ -101,8 +172,11 @@ def file_size_filter(context: ProcessingContext, positional_args: List[str], **k
     Returns:
         True if file size is within specified range
     """
-    file_size = context.file_size
-    
+    return build_file_size_filter(positional_args, kwargs)(context)
+
+
+def build_file_size_filter(positional_args: List[str], kwargs: Dict[str, Any]) -> Callable[[ProcessingContext], bool]:
+    """Create a file size filter with its size bounds parsed up front."""
     # Handle positional arguments
     if positional_args:
         min_size = int(positional_args[0]) if len(positional_args) > 0 and positional_args[0] else 0
@@ -112,7 +186,10 @@ def file_size_filter(context: ProcessingContext, positional_args: List[str], **k
         min_size = int(kwargs.get('min_size', 0))
         max_size = int(kwargs.get('max_size', float('inf')))
     
-    return min_size <= file_size <= max_size
+    def file_size_check(context: ProcessingContext) -> bool:
+        return min_size <= context.file_size <= max_size
+    
+    return file_size_check
 
 
 def name_length_filter(context: ProcessingContext, positional_args: List[str], **kwargs) -> bool:
@@ -129,8 +206,11 @@ def name_length_filter(context: ProcessingContext, positional_args: List[str], *
     Returns:
         True if filename length is within specified range
     """
-    filename_length = len(context.base_name)
-    
+    return build_name_length_filter(positional_args, kwargs)(context)
+
+
+def build_name_length_filter(positional_args: List[str], kwargs: Dict[str, Any]) -> Callable[[ProcessingContext], bool]:
+    """Create a name length filter with its length bounds parsed up front."""
     # Handle positional arguments
     if positional_args:
         min_length = int(positional_args[0]) if len(positional_args) > 0 and positional_args[0] else 0
@@ -140,7 +220,10 @@ def name_length_filter(context: ProcessingContext, positional_args: List[str], *
         min_length = int(kwargs.get('min_length', 0))
         max_length = int(kwargs.get('max_length', float('inf')))
     
-    return min_length <= filename_length <= max_length
+    def name_length_check(context: ProcessingContext) -> bool:
+        return min_length <= len(context.base_name) <= max_length
+    
+    return name_length_check
 
 
 def date_modified_filter(context: ProcessingContext, positional_args: List[str], **kwargs) -> bool:
@@ -159,54 +242,92 @@ def date_modified_filter(context: ProcessingContext, positional_args: List[str],
     Returns:
         True if file modification date meets criteria
     """
+    return build_date_modified_filter(positional_args, kwargs)(context)
+
+
+def _parse_iso_date(date_string: str) -> datetime.datetime:
+    """Parse a YYYY-MM-DD date, accepting exactly what strptime('%Y-%m-%d') does."""
+    match = _ISO_DATE_RE.fullmatch(date_string)
+    if match is None:
+        raise ValueError(f"time data {date_string!r} does not match format '%Y-%m-%d'")
+    year, month, day = match.groups()
+    return datetime.datetime(int(year), int(month), int(day))
+
+
+def build_date_modified_filter(positional_args: List[str], kwargs: Dict[str, Any]) -> Callable[[ProcessingContext], bool]:
+    """Create a date modified filter with its threshold parsed up front."""
     try:
-        file_modified = context.modified_timestamp
-        
         # Handle positional arguments
         if len(positional_args) >= 2:
-            operator = positional_args[0]
+            op_symbol = positional_args[0]
             date_string = positional_args[1]
         else:
             # Handle keyword arguments
-            operator = kwargs.get('operator', '>')
+            op_symbol = kwargs.get('operator', '>')
             date_string = kwargs.get('date')
         
         if not date_string:
-            return True  # No date specified, don't filter
+            return _accept_all  # No date specified, don't filter
         
         # Parse threshold date
         try:
-            threshold_date = datetime.datetime.strptime(date_string, '%Y-%m-%d')
-            threshold_timestamp = threshold_date.timestamp()
+            threshold_timestamp = _parse_iso_date(date_string).timestamp()
         except ValueError:
-            return True  # Invalid date format
-        
-        # Apply comparison
-        if operator == '>':
-            return file_modified > threshold_timestamp
-        elif operator == '<':
-            return file_modified < threshold_timestamp
-        elif operator == '>=':
-            return file_modified >= threshold_timestamp
-        elif operator == '<=':
-            return file_modified <= threshold_timestamp
-        elif operator == '==':
-            # Same day comparison
-            file_date = datetime.datetime.fromtimestamp(file_modified).date()
-            threshold_date = datetime.datetime.fromtimestamp(threshold_timestamp).date()
-            return file_date == threshold_date
-        else:
-            return True
-            
+            return _accept_all  # Invalid date format
     except Exception:
-        return True  # If parsing fails, don't filter
+        return _accept_all  # If parsing fails, don't filter
+    
+    if op_symbol == '==':
+        # Same day comparison
+        threshold_day = datetime.datetime.fromtimestamp(threshold_timestamp).date()
+        
+        def same_day_check(context: ProcessingContext) -> bool:
+            try:
+                return datetime.datetime.fromtimestamp(context.modified_timestamp).date() == threshold_day
+            except Exception:
+                return True  # If comparison fails, don't filter
+        
+        return same_day_check
+    
+    compare = _DATE_COMPARISONS.get(op_symbol) if isinstance(op_symbol, str) else None
+    if compare is None:
+        return _accept_all  # Unknown operator, don't filter
+    
+    def date_modified_check(context: ProcessingContext) -> bool:
+        try:
+            return compare(context.modified_timestamp, threshold_timestamp)
+        except Exception:
+            return True  # If comparison fails, don't filter
+    
+    return date_modified_check
 
 
 # Registry of built-in filters
-BUILTIN_FILTERS = {
+_BUILTIN_FILTERS_IMPL = {
     'pattern': pattern_filter,
     'file-type': file_type_filter,
     'file-size': file_size_filter,
     'name-length': name_length_filter,
     'date-modified': date_modified_filter,
-}
\ No newline at end of file
+}
+
+# Read-only view of the registry
+BUILTIN_FILTERS = types.MappingProxyType(_BUILTIN_FILTERS_IMPL)
+
+# Factories that parse filter arguments once and return per-file callables
+BUILTIN_FILTER_FACTORIES = {
+    'pattern': build_pattern_filter,
+    'file-type': build_file_type_filter,
+    'file-size': build_file_size_filter,
+    'name-length': build_name_length_filter,
+    'date-modified': build_date_modified_filter,
+}
+
+# Relative per-file cost of each built-in filter; cheaper filters run first
+BUILTIN_FILTER_COSTS = {
+    'file-type': 1,
+    'file-size': 1,
+    'name-length': 1,
+    'pattern': 2,
+    'date-modified': 3,
+}
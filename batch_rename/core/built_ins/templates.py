@@ -5,11 +5,19 @@ Templates take a ProcessingContext and return str (formatted filename without ex
 """
 
 import re
-from typing import Dict, Any, List
+import string
+import types
+from typing import Dict, Any, List, Callable, FrozenSet, Tuple
 
 from ..processing_context import ProcessingContext
 
 
+_FIELD_ROOT_RE = re.compile(r'[^.\[]*')
+
+# StringSmith is only imported once a stringsmith template is actually used
+_TemplateFormatter = None
+
+
 def template_formatter(context: ProcessingContext, positional_args: List[str], **kwargs) -> str:
     """
     Simple Python-style string template formatter.
@@ -17,7 +25,8 @@ def template_formatter(context: ProcessingContext, positional_args: List[str], *
     Positional args: [template_string]
     Keyword args: template=template_string
     
-    Uses {field} syntax for field substitution.
+    Uses {field} syntax for field substitution. Fields missing from the
+    extracted data render as empty strings.
     
     Examples:
         template,"{dept}_{type}_{date}"  → "HR_employee_2024"
@@ -26,6 +35,11 @@ def template_formatter(context: ProcessingContext, positional_args: List[str], *
     Returns:
         Formatted filename string (without extension)
     """
+    return build_template_formatter(positional_args, kwargs)(context)
+
+
+def build_template_formatter(positional_args: List[str], kwargs: Dict[str, Any]) -> Callable[[ProcessingContext], str]:
+    """Create a template formatter with its referenced field names parsed up front."""
     # Handle positional arguments
     if positional_args:
         template_str = positional_args[0]
@@ -36,39 +50,63 @@ def template_formatter(context: ProcessingContext, positional_args: List[str], *
     if not template_str:
         raise ValueError("template formatter requires template string")
     
-    if not context.has_extracted_data():
-        return context.base_name
-    
-    # Simple string formatting with extracted data
+    # Parse once into tokens; malformed templates are left for str.format
+    # to reject per file
     try:
-        return template_str.format(**context.extracted_data)
-    except KeyError as e:
-        # Handle missing fields by returning template with available substitutions
-        available_data = {k: v for k, v in context.extracted_data.items() if v}
-        try:
-            # Try partial formatting by creating a safe formatter
-            class SafeFormatter(str):
-                def __mod__(self, values):
-                    return self
-                def format_map(self, mapping):
-                    import string
-                    formatter = string.Formatter()
-                    args = []
-                    kwargs = {}
-                    for literal_text, field_name, format_spec, conversion in formatter.parse(self):
-                        if field_name is not None and field_name in mapping:
-                            kwargs[field_name] = mapping[field_name]
-                    
-                    # Build result with available fields only
-                    result = self
-                    for field, value in kwargs.items():
-                        result = result.replace(f'{{{field}}}', str(value))
-                    return result
-            
-            safe_template = SafeFormatter(template_str)
-            return safe_template.format_map(available_data)
-        except:
-            return template_str  # Fallback to template string
+        tokens = _parse_template(template_str)
+    except ValueError:
+        tokens = None
+    
+    # Every top-level name the template needs ("{date.year}" needs "date")
+    field_roots = frozenset().union(*(roots for _, _, roots in tokens or ()))
+    
+    # format_map reads the extracted dict directly instead of copying it into kwargs
+    format_map = template_str.format_map
+    
+    def format_template(context: ProcessingContext) -> str:
+        data = context.extracted_data
+        if not data:
+            return context.base_name
+        
+        if tokens is None or field_roots.issubset(data):
+            # Simple string formatting with extracted data
+            return format_map(data)
+        
+        # Missing fields render as empty strings; present ones keep their
+        # conversion and format spec
+        return ''.join([
+            literal + field.format_map(data) if roots.issubset(data) else literal
+            for literal, field, roots in tokens
+        ])
+    
+    return format_template
+
+
+def _parse_template(template_str: str) -> List[Tuple[str, str, FrozenSet[str]]]:
+    """
+    Split a format string into (literal, field, roots) tokens.
+    
+    field is the replacement field as its own format string ("{num:03d}"),
+    or "" after the last field; roots are the top-level names it looks up,
+    including names nested in its format spec. Positional fields are left
+    out of roots so that str.format rejects them.
+    """
+    formatter = string.Formatter()
+    tokens = []
+    for literal_text, field_name, format_spec, conversion in formatter.parse(template_str):
+        if field_name is None:
+            tokens.append((literal_text, '', frozenset()))
+            continue
+        
+        names = [field_name]
+        if '{' in format_spec:
+            # Nested fields such as "{num:{width}}" are looked up by str.format too
+            names.extend(name for _, name, _, _ in formatter.parse(format_spec) if name)
+        roots = {_FIELD_ROOT_RE.match(name).group() for name in names}
+        
+        field = '{' + field_name + (f'!{conversion}' if conversion else '') + (f':{format_spec}' if format_spec else '') + '}'
+        tokens.append((literal_text, field, frozenset(root for root in roots if root and not root.isdigit())))
+    return tokens
 
 
 def stringsmith_formatter(context: ProcessingContext, positional_args: List[str], **kwargs) -> str:
@@ -91,6 +129,11 @@ def stringsmith_formatter(context: ProcessingContext, positional_args: List[str]
     Returns:
         Formatted filename string (without extension)
     """
+    return build_stringsmith_formatter(positional_args, kwargs)(context)
+
+
+def build_stringsmith_formatter(positional_args: List[str], kwargs: Dict[str, Any]) -> Callable[[ProcessingContext], str]:
+    """Create a StringSmith formatter whose template is parsed once for the whole batch."""
     # Handle positional arguments
     if positional_args:
         template_str = positional_args[0]
@@ -103,25 +146,40 @@ def stringsmith_formatter(context: ProcessingContext, positional_args: List[str]
         raise ValueError("stringsmith formatter requires template string")
     
     if template_str == '':
-        return ''
-    
-    if not context.has_extracted_data():
-        return context.base_name
+        return lambda context: ''
     
+    # Create formatter with the template; a template StringSmith rejects is
+    # reported for each file that has data to format
     try:
-        # Import StringSmith formatter from shared_utils
-        from shared_utils.stringsmith import TemplateFormatter
-        
-        # Create formatter with the template
-        formatter = TemplateFormatter(template_str)
-        
-        # Format using extracted data
-        result = formatter.format(**context.extracted_data)
+        formatter = _template_formatter_class()(template_str)
+        build_error = None
+    except Exception as e:
+        formatter = None
+        build_error = e
+    
+    def format_stringsmith(context: ProcessingContext) -> str:
+        if not context.has_extracted_data():
+            return context.base_name
         
-        return result
+        if formatter is None:
+            raise ValueError(f"StringSmith formatting failed: {build_error}")
         
-    except Exception as e:
-        raise ValueError(f"StringSmith formatting failed: {e}")
+        try:
+            # Format using extracted data
+            return formatter.format(**context.extracted_data)
+        except Exception as e:
+            raise ValueError(f"StringSmith formatting failed: {e}")
+    
+    return format_stringsmith
+
+
+def _template_formatter_class() -> type:
+    """Import StringSmith's TemplateFormatter on first use and keep it for later batches."""
+    global _TemplateFormatter
+    if _TemplateFormatter is None:
+        # Import StringSmith formatter from shared_utils
+        from shared_utils.stringsmith import TemplateFormatter as _TemplateFormatter
+    return _TemplateFormatter
 
 
 def join_formatter(context: ProcessingContext, positional_args: List[str], **kwargs) -> str:
@@ -141,43 +199,36 @@ def join_formatter(context: ProcessingContext, positional_args: List[str], **kwa
     Returns:
         Specified fields joined with separator
     """
-    if not context.has_extracted_data():
+    data = context.extracted_data
+    if not data:
         return context.base_name
     
     # Get separator from kwargs
     separator = kwargs.get('separator', '_')
     
-    # If no specific fields requested, use all fields
-    if not positional_args:
-        # Get all field values in the order they appear in the dict
-        # Note: Python 3.7+ preserves dict insertion order
-        values = []
-        for field_name, value in context.extracted_data.items():
-            if value:  # Only include non-empty values
-                values.append(str(value))
-        
-        if values:
-            return separator.join(values)
-        else:
-            return context.base_name  # Fallback to original name
-    
-    # Join only specified fields
-    values = []
-    for field_name in positional_args:
-        if field_name in context.extracted_data:
-            value = context.extracted_data[field_name]
-            if value:  # Only include non-empty values
-                values.append(str(value))
-    
-    if values:
-        return separator.join(values)
+    # Only include non-empty values; with no specific fields requested, use
+    # all fields in the order they appear in the dict
+    if positional_args:
+        values = [str(data[field_name]) for field_name in positional_args if data.get(field_name)]
     else:
-        return context.base_name  # Fallback to original name
+        values = [str(value) for value in data.values() if value]
+    
+    return separator.join(values) if values else context.base_name  # Fallback to original name
 
 
 # Registry of built-in templates
-BUILTIN_TEMPLATES = {
+_BUILTIN_TEMPLATES_IMPL = {
     'template': template_formatter,
     'stringsmith': stringsmith_formatter,
     'join': join_formatter,
-}
\ No newline at end of file
+}
+
+# Read-only view of the registry
+BUILTIN_TEMPLATES = types.MappingProxyType(_BUILTIN_TEMPLATES_IMPL)
+
+
+# Factories that build per-file templates once per batch
+BUILTIN_TEMPLATE_FACTORIES = {
+    'template': build_template_formatter,
+    'stringsmith': build_stringsmith_formatter,
+}
@@ -8,8 +8,19 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Union
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+
+# Built-in template names, resolved once from the templates registry
+try:
+    from .built_ins.templates import BUILTIN_TEMPLATES
+    _VALID_BUILTIN_TEMPLATES = tuple(BUILTIN_TEMPLATES)
+except ImportError:
+    # Fallback to hardcoded list if import fails
+    _VALID_BUILTIN_TEMPLATES = ('template', 'stringsmith', 'join')
+
+
+@dataclass(**DATACLASS_SLOTS)
 class RenameConfig:
     """Configuration for batch rename operations."""
     
@@ -29,6 +40,9 @@ class RenameConfig:
     # Execution options
     recursive: bool = False
     preview_mode: bool = True
+    # Threads used to plan files; 1 processes them serially. Custom functions
+    # must be thread-safe when this is above 1.
+    workers: int = 1
     
     # Collision handling
     on_existing_collision: str = 'skip'  # skip, error, append_number
@@ -56,6 +70,10 @@ class RenameConfig:
         if isinstance(self.input_folder, str):
             self.input_folder = Path(self.input_folder)
         
+        # Worker count must be a positive integer (bool is not a count)
+        if not isinstance(self.workers, int) or isinstance(self.workers, bool) or self.workers < 1:
+            raise ValueError(f"workers must be an integer >= 1, got {self.workers!r}")
+        
         # Must have either extractor or extract_and_convert
         if not self.extractor and not self.extract_and_convert:
             raise ValueError("Must specify either extractor or extract_and_convert")
@@ -74,21 +92,13 @@ class RenameConfig:
         if self.template:
             template_name = self.template.get('name', '')
             
-            # Import built-in templates registry
-            try:
-                from .built_ins.templates import BUILTIN_TEMPLATES
-                valid_builtin_templates = BUILTIN_TEMPLATES.keys()
-            except ImportError:
-                # Fallback to hardcoded list if import fails
-                valid_builtin_templates = ['template', 'stringsmith', 'join']
-            
             # Allow built-in templates or custom .py files
-            if template_name not in valid_builtin_templates and not template_name.endswith('.py'):
-                valid_templates_list = list(valid_builtin_templates)
+            if template_name not in _VALID_BUILTIN_TEMPLATES and not template_name.endswith('.py'):
+                valid_templates_list = list(_VALID_BUILTIN_TEMPLATES)
                 raise ValueError(f"Invalid template '{template_name}'. Must be one of {valid_templates_list} or a .py file.")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RenameResult:
     """Results from a batch rename operation."""
     
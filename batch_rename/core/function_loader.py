@@ -4,11 +4,31 @@ Custom function loader for user-provided Python files.
 Handles loading and validation of custom extractor, converter, and filter functions.
 """
 
+import functools
 import importlib.util
+import inspect
 from pathlib import Path
+from types import ModuleType
 from typing import Callable
 
 
+@functools.lru_cache(maxsize=128)
+def _load_module(path_str: str, mtime_ns: int, size: int) -> ModuleType:
+    """
+    Execute a custom function file once per file version.
+    
+    The modification time and size are part of the cache key so an edited
+    file is executed again on its next load.
+    """
+    spec = importlib.util.spec_from_file_location("custom_module", path_str)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load module from {path_str}")
+    
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def load_custom_function(file_path: str, function_name: str) -> Callable:
     """
     Load a custom function from a Python file.
@@ -26,20 +46,17 @@ def load_custom_function(file_path: str, function_name: str) -> Callable:
     """
     path = Path(file_path)
     
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         raise ValueError(f"Function file not found: {file_path}")
     
     if not path.suffix == '.py':
         raise ValueError(f"Function file must be a .py file: {file_path}")
     
     try:
-        # Load the module
-        spec = importlib.util.spec_from_file_location("custom_module", path)
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Could not load module from {file_path}")
-        
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        # Load the module (executed once per file version)
+        module = _load_module(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
         
         # Get the function
         if not hasattr(module, function_name):
@@ -67,7 +84,6 @@ def validate_extractor_function(func: Callable) -> bool:
     def extract_data(context: ProcessingContext, *args, **kwargs) -> dict
     """
     try:
-        import inspect
         sig = inspect.signature(func)
         params = list(sig.parameters.keys())
         
@@ -92,18 +108,7 @@ def validate_converter_function(func: Callable) -> bool:
     Expected signature:
     def convert_data(context: ProcessingContext, *args, **kwargs) -> dict
     """
-    try:
-        import inspect
-        sig = inspect.signature(func)
-        params = list(sig.parameters.keys())
-        
-        # Check that function has at least one parameter (ProcessingContext)
-        if len(params) >= 1:
-            return True
-        else:
-            return False
-    except Exception:
-        return True
+    return _has_any_param(func)
 
 
 def validate_combined_function(func: Callable) -> bool:
@@ -113,15 +118,12 @@ def validate_combined_function(func: Callable) -> bool:
     Expected signature:
     def extract_and_convert(context: ProcessingContext, *args, **kwargs) -> dict
     """
+    return _has_any_param(func)
+
+
+def _has_any_param(func: Callable) -> bool:
+    """Check that a function accepts at least one parameter (ProcessingContext)."""
     try:
-        import inspect
-        sig = inspect.signature(func)
-        params = list(sig.parameters.keys())
-        
-        # Check that function has at least one parameter (ProcessingContext)
-        if len(params) >= 1:
-            return True
-        else:
-            return False
+        return len(inspect.signature(func).parameters) >= 1
     except Exception:
-        return True
\ No newline at end of file
+        return True
@@ -4,12 +4,14 @@ Processing Context Data Class for Batch Rename Tool
 Encapsulates all automatic arguments passed by the processor to custom functions.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ProcessingContext:
     """
     Context object containing all automatic arguments for custom functions.
@@ -22,15 +24,14 @@ class ProcessingContext:
     metadata: Dict[str, Any]
     extracted_data: Optional[Dict[str, Any]] = None
     
-    @property
-    def base_name(self) -> str:
-        """Get filename without extension."""
-        return self.file_path.stem
+    # Path-derived names are computed once; every step in the pipeline reads them
+    base_name: str = field(init=False, repr=False, compare=False)  # Filename without extension
+    extension: str = field(init=False, repr=False, compare=False)  # File extension
     
-    @property
-    def extension(self) -> str:
-        """Get file extension."""
-        return self.file_path.suffix
+    def __post_init__(self):
+        """Derive the base name and extension from the file path."""
+        self.base_name = self.file_path.stem
+        self.extension = self.file_path.suffix
     
     @property
     def file_size(self) -> int:
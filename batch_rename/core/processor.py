@@ -21,14 +21,33 @@ Safety Features:
     - Comprehensive error tracking and reporting
 """
 
-import shutil
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Iterator, NamedTuple, Optional, Tuple
 
 from .config import RenameConfig, RenameResult
 from .processing_context import ProcessingContext
 from .step_factory import StepFactory
 from .steps.base import StepConfig, StepType
+from .built_ins.filters import BUILTIN_FILTER_COSTS
+
+_logger = logging.getLogger(__name__)
+
+# Custom filters may have side effects, so they run after every built-in
+_CUSTOM_FILTER_COST = max(BUILTIN_FILTER_COSTS.values()) + 1
+
+
+def _keep_base_name(context: ProcessingContext) -> str:
+    """Template used when none is configured: keep the original name."""
+    return context.base_name
+
+
+class _FileEntry(NamedTuple):
+    """A file to process, with the stat taken while listing the folder."""
+    path: Path
+    stat: os.stat_result
 
 
 class BatchRenameProcessor:
@@ -59,76 +78,19 @@ class BatchRenameProcessor:
         else:
             return self._process_with_pipeline(config, files, result)
     
-    def _process_with_pipeline(self, config: RenameConfig, files: List[Path], result: RenameResult) -> RenameResult:
+    def _process_with_pipeline(self, config: RenameConfig, files: List[_FileEntry], result: RenameResult) -> RenameResult:
         """Process files using the full extraction -> conversion -> template pipeline."""
         
         # Create processing steps
         steps = self._create_processing_steps(config)
         
-        # Process each file
-        rename_plan = []
-        for file_path in files:
-            try:
-                print(f"\nDEBUG: === Processing {file_path.name} ===")
-                
-                # Get file metadata
-                metadata = self._get_file_metadata(file_path)
-                
-                # Create processing context
-                context = ProcessingContext(
-                    filename=file_path.name,
-                    file_path=file_path,
-                    metadata=metadata
-                )
-                
-                # Apply filters first - if any filter returns False, skip file
-                if not self._apply_filters(context, steps['filters']):
-                    continue
-                
-                
-                # Extract data
-                extracted_data = steps['extractor'](context)
-                context.extracted_data = extracted_data
-                
-                # Apply converters in sequence
-                converted_data = extracted_data.copy()
-                
-                for i, converter in enumerate(steps['converters']):
-                    context.extracted_data = converted_data
-                    converter_result = converter(context)
-                    converted_data = converter_result
-
-                
-                # Apply template formatter
-                if steps['template']:
-                    context.extracted_data = converted_data
-                    new_base_name = steps['template'](context)
-                else:
-                    new_base_name = context.base_name
-                
-                
-                # Generate new filename (preserve extension)
-                new_name = self._generate_new_filename(new_base_name, file_path)
-                
-                # Add to rename plan
-                rename_plan.append({
-                    'old_path': file_path,
-                    'old_name': file_path.name,
-                    'new_name': new_name,
-                    'new_path': file_path.parent / new_name
-                })
-                
-            except Exception as e:
-                result.errors += 1
-                result.error_details.append({
-                    'file': file_path.name,
-                    'error': str(e)
-                })
+        run_pipeline = self._compile_pipeline(steps)
         
-        # Execute rename plan
+        # Plan each file, then execute rename plan
+        rename_plan = self._collect_rename_plan(config, files, steps['filters'], run_pipeline, result)
         return self._execute_rename_plan(config, rename_plan, result)
     
-    def _process_with_all_in_one(self, config: RenameConfig, files: List[Path], result: RenameResult) -> RenameResult:
+    def _process_with_all_in_one(self, config: RenameConfig, files: List[_FileEntry], result: RenameResult) -> RenameResult:
         """Process files using all-in-one function that handles extraction + conversion + formatting."""
         
         # Create all-in-one function using StepFactory
@@ -142,47 +104,100 @@ class BatchRenameProcessor:
         # Create filter functions
         filter_steps = self._create_filter_steps(config.filters)
         
-        # Process each file
-        rename_plan = []
-        for file_path in files:
+        # Plan each file, then execute rename plan
+        rename_plan = self._collect_rename_plan(config, files, filter_steps, all_in_one_func, result)
+        return self._execute_rename_plan(config, rename_plan, result)
+    
+    def _compile_pipeline(self, steps: Dict[str, Any]) -> Callable[[ProcessingContext], str]:
+        """
+        Bind the extractor, converters and template into one per-file function.
+        
+        The returned function runs them on a context and returns the new base
+        name. Steps are bound as closure variables so each file skips the
+        steps-dict lookups and the template check.
+        """
+        extractor = steps['extractor']
+        converters = tuple(steps['converters'])
+        template = steps['template'] or _keep_base_name
+        
+        def run_pipeline(context: ProcessingContext) -> str:
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug("Processing %s", context.filename)
+            
+            # Extract data
+            data = extractor(context)
+            
+            # Apply converters in sequence; each returns a new dict (or its input
+            # unchanged), so the extracted data needs no defensive copy
+            for converter in converters:
+                context.extracted_data = data
+                data = converter(context)
+            context.extracted_data = data
+            
+            # Apply template formatter
+            return template(context)
+        
+        return run_pipeline
+    
+    def _collect_rename_plan(self, config: RenameConfig, files: List[_FileEntry], filters: List[Tuple[Callable, bool]],
+                             rename_func: Callable[[ProcessingContext], str], result: RenameResult) -> List[Dict]:
+        """
+        Plan the rename of every file, recording per-file errors in result.
+        
+        With config.workers > 1 files are planned on a thread pool; results are
+        still gathered on this thread in file order, so the plan and the error
+        details come out the same as with serial processing.
+        """
+        def plan_file(entry: _FileEntry):
             try:
-                # Get file metadata
-                metadata = self._get_file_metadata(file_path)
-                
-                # Create processing context
-                context = ProcessingContext(
-                    filename=file_path.name,
-                    file_path=file_path,
-                    metadata=metadata
-                )
-                
-                # Apply filters first
-                if not self._apply_filters(context, filter_steps):
-                    continue
-                
-                # Apply all-in-one function
-                new_base_name = all_in_one_func(context)
-                
-                # Generate new filename (preserve extension)
-                new_name = self._generate_new_filename(new_base_name, file_path)
-                
-                # Add to rename plan
-                rename_plan.append({
-                    'old_path': file_path,
-                    'old_name': file_path.name,
-                    'new_name': new_name,
-                    'new_path': file_path.parent / new_name
-                })
-                
+                return self._plan_file(entry, filters, rename_func), None
             except Exception as e:
+                return None, e
+        
+        if config.workers > 1 and len(files) > 1:
+            with ThreadPoolExecutor(max_workers=config.workers) as executor:
+                outcomes = list(executor.map(plan_file, files))
+        else:
+            outcomes = map(plan_file, files)
+        
+        rename_plan = []
+        for entry, (plan_item, error) in zip(files, outcomes):
+            if error is not None:
                 result.errors += 1
                 result.error_details.append({
-                    'file': file_path.name,
-                    'error': str(e)
+                    'file': entry.path.name,
+                    'error': str(error)
                 })
+            elif plan_item is not None:
+                rename_plan.append(plan_item)
         
-        # Execute rename plan
-        return self._execute_rename_plan(config, rename_plan, result)
+        return rename_plan
+    
+    def _plan_file(self, entry: _FileEntry, filters: List[Tuple[Callable, bool]],
+                   rename_func: Callable[[ProcessingContext], str]) -> Optional[Dict]:
+        """Build the rename plan entry for one file, or None if a filter rejects it."""
+        file_path = entry.path
+        
+        # Create processing context
+        context = ProcessingContext(
+            filename=file_path.name,
+            file_path=file_path,
+            metadata=self._get_file_metadata(entry.stat)
+        )
+        
+        # Apply filters first - if any filter returns False, skip file
+        if not self._apply_filters(context, filters):
+            return None
+        
+        # Generate new filename (preserve extension)
+        new_name = self._generate_new_filename(rename_func(context), file_path)
+        
+        return {
+            'old_path': file_path,
+            'old_name': file_path.name,
+            'new_name': new_name,
+            'new_path': file_path.parent / new_name
+        }
     
     def _create_processing_steps(self, config: RenameConfig) -> Dict[str, Any]:
         """Create all processing step functions from configuration."""
@@ -233,11 +248,18 @@ class BatchRenameProcessor:
         
         return steps
     
-    def _create_filter_steps(self, filter_configs: List[Dict]) -> List[Any]:
-        """Create filter step functions from configuration."""
+    def _create_filter_steps(self, filter_configs: List[Dict]) -> List[Tuple[Callable, bool]]:
+        """Create filter step functions from configuration, cheapest first."""
         filters = []
         
-        for filt in filter_configs:
+        # All filters must pass, so order only affects how early a file is
+        # rejected; the sort is stable so equal-cost filters keep their order
+        ordered_configs = sorted(
+            filter_configs,
+            key=lambda filt: BUILTIN_FILTER_COSTS.get(filt['name'], _CUSTOM_FILTER_COST)
+        )
+        
+        for filt in ordered_configs:
             filter_config = StepConfig(
                 name=filt['name'],
                 positional_args=filt.get('positional', []),
@@ -245,28 +267,19 @@ class BatchRenameProcessor:
             )
             filter_func = StepFactory.create_executable(StepType.FILTER, filter_config)
             
-            # Handle filter inversion
-            if filt.get('inverted', False):
-                def inverted_filter(context, original_func=filter_func):
-                    return not original_func(context)
-                filters.append(inverted_filter)
-            else:
-                filters.append(filter_func)
+            # Inversion is applied by _apply_filters rather than a wrapper closure
+            filters.append((filter_func, bool(filt.get('inverted', False))))
         
         return filters
     
-    def _apply_filters(self, context: ProcessingContext, filters: List[Callable]) -> bool:
-        """Apply all filters to context. Returns True if file should be processed."""
-        
-        for i, filter_func in enumerate(filters):
-            try:
-                result = filter_func(context)
-                if not result:
-                    return False
-            except Exception as e:
-                return False
-        
-        return True
+    def _apply_filters(self, context: ProcessingContext, filters: List[Tuple[Callable, bool]]) -> bool:
+        """Apply all (filter, inverted) pairs to context. Returns True if file should be processed."""
+        
+        try:
+            # A filter passes when its result differs from its inversion flag
+            return all(bool(filter_func(context)) is not inverted for filter_func, inverted in filters)
+        except Exception:
+            return False
     
     def _generate_new_filename(self, new_base_name: str, original_path: Path) -> str:
         """Generate new filename, preserving extension."""
@@ -279,15 +292,15 @@ class BatchRenameProcessor:
         """
         Execute the rename plan and update results with collision detection.
         
-        Performs collision detection using set comparison to identify files that
-        would have duplicate new names. Only processes files where the new name
-        differs from the old name to avoid unnecessary operations.
+        Performs collision detection in the same pass that selects the changed
+        files, so files that would have duplicate new names are counted without
+        building intermediate name lists. Only processes files where the new
+        name differs from the old name to avoid unnecessary operations.
         
         Collision Detection Algorithm:
-            1. Filter to actual changes (old_name != new_name)
-            2. Extract all new names into a list  
-            3. Compare list length to set length to count duplicates
-            4. Store collision count and preview data
+            1. Skip unchanged files (old_name == new_name)
+            2. Count a collision whenever a new name has already been seen
+            3. Store collision count and preview data
             
         Args:
             config: Rename configuration including preview mode setting
@@ -307,32 +320,42 @@ class BatchRenameProcessor:
         
         # Exclude files where old_name == new_name to avoid unnecessary operations
         # and provide accurate metrics for the preview/execution summary
-        actual_changes = [
-            item for item in rename_plan 
-            if item['old_name'] != item['new_name']
-        ]
+        actual_changes = []
+        preview_data = []
+        seen_names = set()
+        collisions = 0
+        
+        for item in rename_plan:
+            old_name = item['old_name']
+            new_name = item['new_name']
+            if old_name == new_name:
+                continue
+            
+            # Every repeat of a new name collides with the first file to claim it
+            if new_name in seen_names:
+                collisions += 1
+            else:
+                seen_names.add(new_name)
+            
+            actual_changes.append(item)
+            preview_data.append({'old_name': old_name, 'new_name': new_name})
         
         result.files_to_rename = len(actual_changes)
-        
-        # Check for collisions among the changed files
-        new_names = [item['new_name'] for item in actual_changes]
-        collisions = len(new_names) - len(set(new_names))
         result.collisions = collisions
         
         # Set preview data to only show actual changes
-        result.preview_data = [
-            {'old_name': item['old_name'], 'new_name': item['new_name']}
-            for item in actual_changes
-        ]
+        result.preview_data = preview_data
         
         # If preview mode, don't actually rename
         if config.preview_mode:
             return result
         
-        # Execute renames (only for files that actually changed)
+        # Execute renames (only for files that actually changed). New paths share
+        # the old file's folder, so a plain rename is always a single syscall.
+        # Renames stay serial: a plan like a->b, b->c depends on their order.
         for item in actual_changes:
             try:
-                shutil.move(str(item['old_path']), str(item['new_path']))
+                os.rename(item['old_path'], item['new_path'])
                 result.files_renamed += 1
             except Exception as e:
                 result.errors += 1
@@ -343,28 +366,45 @@ class BatchRenameProcessor:
         
         return result
     
-    def _get_file_list(self, config: RenameConfig) -> List[Path]:
-        """Get list of files to process."""
-        files = []
-        
-        if config.recursive:
-            pattern = "**/*"
-        else:
-            pattern = "*"
-        
-        for file_path in config.input_folder.glob(pattern):
-            if file_path.is_file():
-                files.append(file_path)
+    def _get_file_list(self, config: RenameConfig) -> List[_FileEntry]:
+        """Get list of files to process, each with its stat result."""
+        return list(self._scan_files(config.input_folder, config.recursive))
+    
+    def _scan_files(self, folder: Path, recursive: bool) -> Iterator[_FileEntry]:
+        """
+        Walk a folder with os.scandir, yielding regular files and their stat.
         
-        return files
+        Matches Path.glob('*') / Path.glob('**/*'): symlinks to files are
+        included, symlinked directories are not descended into, unreadable
+        directories are skipped, and subfolders are visited depth-first in
+        listing order after the files of their parent.
+        """
+        pending = [folder]
+        while pending:
+            directory = pending.pop()
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file():
+                                yield _FileEntry(Path(entry.path), entry.stat())
+                            elif recursive and entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                        except OSError:
+                            continue  # Vanished or unreadable entry
+            except OSError:
+                continue  # Missing or unreadable directory
+            
+            # Reversed so the first subfolder is popped next
+            pending.extend(reversed(subdirs))
     
-    def _get_file_metadata(self, file_path: Path) -> Dict[str, Any]:
-        """Get metadata for a file."""
-        stat = file_path.stat()
+    def _get_file_metadata(self, file_stat: os.stat_result) -> Dict[str, Any]:
+        """Get metadata for a file from its stat result."""
         return {
-            'size': stat.st_size,
-            'created_timestamp': stat.st_ctime,
-            'modified_timestamp': stat.st_mtime
+            'size': file_stat.st_size,
+            'created_timestamp': file_stat.st_ctime,
+            'modified_timestamp': file_stat.st_mtime
         }
     
     def _validate_converter_fields(self, input_fields: set, output_data: Dict[str, Any], converter_name: str):
@@ -377,16 +417,13 @@ class BatchRenameProcessor:
         # Check for removed fields - warn but don't error (might be intentional)
         removed_fields = input_fields - output_fields
         if removed_fields:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Converter '{converter_name}' removed fields: {removed_fields}")
+            _logger.warning("Converter '%s' removed fields: %s", converter_name, removed_fields)
         
         # Log added fields for debugging (usually good)
-        added_fields = output_fields - input_fields
-        if added_fields:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Converter '{converter_name}' added fields: {added_fields}")
+        if _logger.isEnabledFor(logging.DEBUG):
+            added_fields = output_fields - input_fields
+            if added_fields:
+                _logger.debug("Converter '%s' added fields: %s", converter_name, added_fields)
         
         # Ensure we have some output fields
         if not output_fields:
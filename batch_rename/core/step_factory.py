@@ -4,7 +4,7 @@ Factory for creating processing step instances.
 Centralizes step creation and provides easy access to step functionality.
 """
 
-from typing import Dict, Type, List, Callable
+from typing import Dict, Type, List, Callable, Tuple
 from .steps.base import ProcessingStep, StepType, StepConfig
 from .steps import ExtractorStep, ConverterStep, FilterStep, TemplateStep, AllInOneStep
 
@@ -21,8 +21,15 @@ class StepFactory:
         StepType.ALLINONE: AllInOneStep,
     }
     
-    # Singleton instances for reuse
-    _instances: Dict[StepType, ProcessingStep] = {}
+    # Singleton instances for reuse; steps are stateless, so build them up front
+    _instances: Dict[StepType, ProcessingStep] = {
+        step_type: step_class() for step_type, step_class in _STEP_CLASSES.items()
+    }
+    
+    # Step types are fixed, so the execution order only needs sorting once
+    _sorted_steps: Tuple[ProcessingStep, ...] = tuple(
+        sorted(_instances.values(), key=lambda step: step.get_execution_order())
+    )
     
     @classmethod
     def get_step(cls, step_type: StepType) -> ProcessingStep:
@@ -35,10 +42,6 @@ class StepFactory:
         Returns:
             ProcessingStep instance
         """
-        if step_type not in cls._instances:
-            step_class = cls._STEP_CLASSES[step_type]
-            cls._instances[step_type] = step_class()
-        
         return cls._instances[step_type]
     
     @classmethod
@@ -49,8 +52,7 @@ class StepFactory:
         Returns:
             List of all step instances sorted by execution order
         """
-        steps = [cls.get_step(step_type) for step_type in StepType]
-        return sorted(steps, key=lambda step: step.get_execution_order())
+        return list(cls._sorted_steps)
     
     @classmethod
     def create_executable(cls, step_type: StepType, config: StepConfig) -> Callable:
@@ -92,7 +94,8 @@ class StepFactory:
             Dict of built-in function names to functions
         """
         step = cls.get_step(step_type)
-        return step.builtin_functions
+        # Steps expose a read-only view; callers get their own copy to modify
+        return dict(step.builtin_functions)
     
     @classmethod
     def validate_custom_function(cls, step_type: StepType, function: Callable):
@@ -15,6 +15,8 @@ from ..built_ins.all_in_ones import BUILTIN_ALL_IN_ONE
 class AllInOneStep(ProcessingStep):
     """Processing step for all-in-one extraction, conversion, and formatting."""
     
+    _BUILTINS = BUILTIN_ALL_IN_ONE
+    
     @property
     def step_type(self) -> StepType:
         return StepType.ALLINONE
@@ -23,11 +25,7 @@ class AllInOneStep(ProcessingStep):
     def is_stackable(self) -> bool:
         return False  # Only one all-in-one function per pipeline
     
-    @property
-    def builtin_functions(self) -> Dict[str, Callable]:
-        return BUILTIN_ALL_IN_ONE.copy()
-    
-    def get_help_text(self) -> str:
+    def _build_help_text(self) -> str:
         """Return help text for all-in-one step."""
         help_lines = [
             "ALL-IN-ONE - Handle extraction, conversion, and formatting in one function",
@@ -5,14 +5,17 @@ Defines the common interface and behavior for extractors, converters, filters, a
 Enables consistent GUI panel generation and pipeline management.
 """
 
+import functools
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, Any, Callable, List, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Any, Callable, FrozenSet, List, Optional
 from dataclasses import dataclass
-from pathlib import Path
 
+from .._compat import DATACLASS_SLOTS
 from ..processing_context import ProcessingContext
 from ..validators import ValidationResult
+from ..function_loader import load_custom_function
 
 
 class StepType(Enum):
@@ -24,17 +27,36 @@ class StepType(Enum):
     ALLINONE = "allinone"
 
 
-# Cache the list for O(1) execution order lookup
-_STEP_ORDER_LIST = list(StepType)
+# Execution order (1-based) by step type, following the enum definition order
+_STEP_ORDER = {step_type: order for order, step_type in enumerate(StepType, 1)}
 
+# Rendered help text per step class; built-in registries are fixed at import
+_HELP_TEXT_CACHE: Dict[type, str] = {}
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class StepConfig:
     """Configuration for a processing step instance."""
     name: str  # Function name or built-in identifier
     positional_args: List[Any]
     keyword_args: Dict[str, Any]
     custom_function_path: Optional[str] = None  # Path to .py file if custom
+    
+    def __post_init__(self):
+        # Built-ins receive positional_args as a keyword, so it cannot also be a user keyword
+        if self.keyword_args and 'positional_args' in self.keyword_args:
+            raise ValueError(f"{self.name}: 'positional_args' cannot be used as a keyword argument")
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_custom_function(step: 'ProcessingStep', function: Callable) -> ValidationResult:
+    """
+    Validate a custom function once per step and function object.
+    
+    Loaded modules are cached per file version, so an unchanged file yields the
+    same function object and an edited file yields a new one to validate.
+    """
+    return step.validate_custom_function(function)
 
 
 class ProcessingStep(ABC):
@@ -51,6 +73,16 @@ class ProcessingStep(ABC):
     - Provide GUI generation hints
     """
     
+    # Registry of built-in functions, declared by each step type
+    _BUILTINS: Mapping[str, Callable] = MappingProxyType({})
+    
+    # Names of the built-ins, derived once per step type for membership tests
+    _BUILTIN_NAMES: FrozenSet[str] = frozenset()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._BUILTIN_NAMES = frozenset(cls._BUILTINS)
+    
     @property
     @abstractmethod
     def step_type(self) -> StepType:
@@ -64,14 +96,31 @@ class ProcessingStep(ABC):
         pass
     
     @property
-    @abstractmethod
-    def builtin_functions(self) -> Dict[str, Callable]:
-        """Return dict of available built-in functions for this step type."""
-        pass
+    def builtin_functions(self) -> Mapping[str, Callable]:
+        """Return read-only mapping of available built-in functions for this step type."""
+        return self._BUILTINS
+    
+    @property
+    def builtin_factories(self) -> Dict[str, Callable]:
+        """
+        Return dict of factories for built-ins that can pre-parse their arguments.
+        
+        A factory takes (positional_args, keyword_args) and returns a callable that
+        only needs the ProcessingContext. Step types without factories return {}.
+        """
+        return {}
     
-    @abstractmethod
     def get_help_text(self) -> str:
         """Return help text describing this step and its built-in functions."""
+        step_class = type(self)
+        help_text = _HELP_TEXT_CACHE.get(step_class)
+        if help_text is None:
+            help_text = _HELP_TEXT_CACHE[step_class] = self._build_help_text()
+        return help_text
+    
+    @abstractmethod
+    def _build_help_text(self) -> str:
+        """Render the help text returned (and cached) by get_help_text."""
         pass
     
     @abstractmethod
@@ -100,26 +149,33 @@ class ProcessingStep(ABC):
         Raises:
             ValueError: If configuration is invalid or function not found
         """
-        if config.name in self.builtin_functions:
+        if config.name in self._BUILTIN_NAMES:
             return self._wrap_builtin_function(config)
-        elif Path(config.name).suffix == '.py':
+        elif config.name.endswith('.py'):
             return self._wrap_custom_function(config)
         else:
             raise ValueError(f"Unknown {self.step_type.value}: {config.name}")
     
     def _wrap_builtin_function(self, config: StepConfig) -> Callable:
         """Wrap a built-in function with configuration."""
-        builtin_func = self.builtin_functions[config.name]
-        
-        def configured_builtin(context: ProcessingContext):
-            return builtin_func(context, config.positional_args, **config.keyword_args)
+        factory = self.builtin_factories.get(config.name)
+        if factory is not None:
+            try:
+                return factory(config.positional_args, config.keyword_args)
+            except (ValueError, TypeError):
+                # Invalid arguments keep being reported per file by the plain built-in
+                pass
         
-        return configured_builtin
+        # Built-ins take (context, positional_args, **kwargs), so only the
+        # context is left to pass per file
+        return functools.partial(
+            self.builtin_functions[config.name],
+            positional_args=config.positional_args,
+            **config.keyword_args
+        )
     
     def _wrap_custom_function(self, config: StepConfig) -> Callable:
         """Load and wrap a custom function with configuration."""
-        from ..function_loader import load_custom_function
-        
         if not config.positional_args:
             raise ValueError(f"Custom {self.step_type.value} requires function name as first argument")
         
@@ -127,15 +183,21 @@ class ProcessingStep(ABC):
         custom_func = load_custom_function(config.name, function_name)
         
         # Validate the custom function
-        validation = self.validate_custom_function(custom_func)
+        validation = _validate_custom_function(self, custom_func)
         if not validation.valid:
             raise ValueError(f"Invalid custom {self.step_type.value}: {validation.message}")
         
         # Get additional arguments (excluding function name)
-        additional_args = config.positional_args[1:]
+        additional_args = tuple(config.positional_args[1:])
+        keyword_args = config.keyword_args
+        
+        if not additional_args:
+            return functools.partial(custom_func, **keyword_args)
         
+        # Extra positionals follow the context, which partial cannot bind ahead of;
+        # the closure reads bound locals rather than config attributes per call
         def configured_custom(context: ProcessingContext):
-            return custom_func(context, *additional_args, **config.keyword_args)
+            return custom_func(context, *additional_args, **keyword_args)
         
         return configured_custom
     
@@ -170,7 +232,7 @@ class ProcessingStep(ABC):
         Returns:
             Integer representing execution order (1-based)
         """
-        return _STEP_ORDER_LIST.index(self.step_type) + 1
+        return _STEP_ORDER[self.step_type]
     
     def __repr__(self) -> str:
         """Return string representation for debugging."""
@@ -4,7 +4,6 @@ Converter processing step implementation.
 Handles transformation of extracted data fields.
 """
 
-from pathlib import Path
 from typing import Dict, Any, Callable
 
 from .base import ProcessingStep, StepType, StepConfig
@@ -17,6 +16,8 @@ from ..function_loader import load_custom_function
 class ConverterStep(ProcessingStep):
     """Processing step for data field transformation."""
     
+    _BUILTINS = BUILTIN_CONVERTERS
+    
     @property
     def step_type(self) -> StepType:
         return StepType.CONVERTER
@@ -25,11 +26,7 @@ class ConverterStep(ProcessingStep):
     def is_stackable(self) -> bool:
         return True  # Multiple converters can be chained
     
-    @property
-    def builtin_functions(self) -> Dict[str, Callable]:
-        return BUILTIN_CONVERTERS.copy()
-    
-    def get_help_text(self) -> str:
+    def _build_help_text(self) -> str:
         """Return help text for converter step."""
         help_lines = [
             "CONVERTERS - Transform extracted data fields",
@@ -4,19 +4,20 @@ Extractor processing step implementation.
 Handles data extraction from filenames and metadata.
 """
 
-from pathlib import Path
 from typing import Dict, Any, Callable
 
 from .base import ProcessingStep, StepType, StepConfig
 from ..processing_context import ProcessingContext
 from ..validators import ValidationResult, validate_extractor_function
-from ..built_ins.extractors import BUILTIN_EXTRACTORS
+from ..built_ins.extractors import BUILTIN_EXTRACTORS, BUILTIN_EXTRACTOR_FACTORIES
 from ..function_loader import load_custom_function
 
 
 class ExtractorStep(ProcessingStep):
     """Processing step for data extraction from filenames/metadata."""
     
+    _BUILTINS = BUILTIN_EXTRACTORS
+    
     @property
     def step_type(self) -> StepType:
         return StepType.EXTRACTOR
@@ -26,10 +27,10 @@ class ExtractorStep(ProcessingStep):
         return False  # Only one extractor per pipeline
     
     @property
-    def builtin_functions(self) -> Dict[str, Callable]:
-        return BUILTIN_EXTRACTORS.copy()
+    def builtin_factories(self) -> Dict[str, Callable]:
+        return BUILTIN_EXTRACTOR_FACTORIES
     
-    def get_help_text(self) -> str:
+    def _build_help_text(self) -> str:
         """Return help text for extractor step."""
         help_lines = [
             "EXTRACTORS - Extract data from filenames and metadata",
@@ -9,12 +9,14 @@ from typing import Dict, Any, Callable
 from .base import ProcessingStep, StepType, StepConfig
 from ..processing_context import ProcessingContext
 from ..validators import ValidationResult, validate_filter_function
-from ..built_ins.filters import BUILTIN_FILTERS
+from ..built_ins.filters import BUILTIN_FILTERS, BUILTIN_FILTER_FACTORIES
 
 
 class FilterStep(ProcessingStep):
     """Processing step for file filtering."""
     
+    _BUILTINS = BUILTIN_FILTERS
+    
     @property
     def step_type(self) -> StepType:
         return StepType.FILTER
@@ -24,10 +26,10 @@ class FilterStep(ProcessingStep):
         return True  # Multiple filters can be chained (all must pass)
     
     @property
-    def builtin_functions(self) -> Dict[str, Callable]:
-        return BUILTIN_FILTERS.copy()
+    def builtin_factories(self) -> Dict[str, Callable]:
+        return BUILTIN_FILTER_FACTORIES
     
-    def get_help_text(self) -> str:
+    def _build_help_text(self) -> str:
         """Return help text for filter step."""
         help_lines = [
             "FILTERS - Determine which files to process",
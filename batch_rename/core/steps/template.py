@@ -9,12 +9,14 @@ from typing import Dict, Any, Callable
 from .base import ProcessingStep, StepType, StepConfig
 from ..processing_context import ProcessingContext
 from ..validators import ValidationResult, validate_template_function
-from ..built_ins.templates import BUILTIN_TEMPLATES
+from ..built_ins.templates import BUILTIN_TEMPLATES, BUILTIN_TEMPLATE_FACTORIES
 
 
 class TemplateStep(ProcessingStep):
     """Processing step for final filename formatting."""
     
+    _BUILTINS = BUILTIN_TEMPLATES
+    
     @property
     def step_type(self) -> StepType:
         return StepType.TEMPLATE
@@ -24,10 +26,10 @@ class TemplateStep(ProcessingStep):
         return False  # Only one template per pipeline
     
     @property
-    def builtin_functions(self) -> Dict[str, Callable]:
-        return BUILTIN_TEMPLATES.copy()
+    def builtin_factories(self) -> Dict[str, Callable]:
+        return BUILTIN_TEMPLATE_FACTORIES
     
-    def get_help_text(self) -> str:
+    def _build_help_text(self) -> str:
         """Return help text for template step."""
         help_lines = [
             "TEMPLATES - Format final filename from extracted data",
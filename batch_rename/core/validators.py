@@ -5,10 +5,15 @@ Provides type-specific validation for extractors, converters, templates, filters
 """
 
 import inspect
+import weakref
 from typing import Callable, List
 from dataclasses import dataclass
 
 
+# Signatures per function object; entries go away with the function itself
+_SIGNATURE_CACHE: "weakref.WeakKeyDictionary[Callable, inspect.Signature]" = weakref.WeakKeyDictionary()
+
+
 @dataclass
 class ValidationResult:
     """Result of function validation."""
@@ -16,76 +21,174 @@ class ValidationResult:
     message: str
     parameters: List[inspect.Parameter]
 
+# Parameter names that identify the ProcessingContext argument
+_CONTEXT_PARAM_NAMES = frozenset({'context', 'ctx', 'processing_context'})
+
+
+def _cached_signature(function: Callable) -> inspect.Signature:
+    """Return inspect.signature(function), computed once per function object."""
+    try:
+        return _SIGNATURE_CACHE[function]
+    except KeyError:
+        pass
+    except TypeError:
+        # Not weak-referenceable or not hashable; nothing to cache against
+        return inspect.signature(function)
+    
+    sig = _SIGNATURE_CACHE[function] = inspect.signature(function)
+    return sig
+
 
 def _looks_like_context_param(param: inspect.Parameter) -> bool:
     """Check if parameter appears to be ProcessingContext."""
-    # Check type annotation
-    if param.annotation != param.empty:
-        annotation_str = str(param.annotation)
-        if 'ProcessingContext' in annotation_str:
+    # Check type annotation; a class annotation is matched by name before
+    # falling back to its text (string and generic annotations)
+    annotation = param.annotation
+    if annotation is not param.empty:
+        if getattr(annotation, '__name__', None) == 'ProcessingContext' or 'ProcessingContext' in str(annotation):
             return True
     
     # Check parameter name
-    context_names = ['context', 'ctx', 'processing_context']
-    return param.name.lower() in context_names
+    return param.name.lower() in _CONTEXT_PARAM_NAMES
 
 
-def validate_extractor_function(function: Callable) -> ValidationResult:
-    """
-    Validate extractor function signature.
-    
-    Expected signature: def extract_data(context: ProcessingContext, *args, **kwargs) -> Dict[str, Any]
-    Expected return: Dictionary with extracted field data
-    """
+@dataclass(frozen=True)
+class _FunctionSpec:
+    """What differs between the validators of each function type."""
+    label: str  # Message heading, e.g. "Extractor"
+    subject: str  # Subject of the missing-parameter message
+    error_name: str  # Name used when the signature cannot be inspected
+    return_keyword: str  # Lowercase text expected in the return annotation
+    return_type: str  # Return type named when the annotation matches
+    return_warning: str  # Explanation when the annotation does not match
+    return_hint: str  # Return type suggested when there is no annotation
+    returns: str  # Description of the expected return value
+
+
+_EXTRACTOR_SPEC = _FunctionSpec(
+    label='Extractor',
+    subject='Extractor',
+    error_name='extractor',
+    return_keyword='dict',
+    return_type='Dict',
+    return_warning='Dict[str, Any] (extracted fields)',
+    return_hint='Dict[str, Any]',
+    returns='Dict with extracted field data'
+)
+
+_CONVERTER_SPEC = _FunctionSpec(
+    label='Converter',
+    subject='Converter',
+    error_name='converter',
+    return_keyword='dict',
+    return_type='Dict',
+    return_warning='Dict[str, Any] (transformed data)',
+    return_hint='Dict[str, Any]',
+    returns='Dict with converted/transformed data'
+)
+
+_TEMPLATE_SPEC = _FunctionSpec(
+    label='Template',
+    subject='Template',
+    error_name='template',
+    return_keyword='str',
+    return_type='str',
+    return_warning='str (formatted filename)',
+    return_hint='str',
+    returns='str (formatted filename without extension)'
+)
+
+_FILTER_SPEC = _FunctionSpec(
+    label='Filter',
+    subject='Filter',
+    error_name='filter',
+    return_keyword='bool',
+    return_type='bool',
+    return_warning='bool (True = process, False = skip)',
+    return_hint='bool',
+    returns='bool (True = process file, False = skip file)'
+)
+
+_ALLINONE_SPEC = _FunctionSpec(
+    label='All-in-One',
+    subject='All-in-one function',
+    error_name='all-in-one',
+    return_keyword='str',
+    return_type='str',
+    return_warning='str (formatted filename)',
+    return_hint='str',
+    returns='str (complete formatted filename without extension)'
+)
+
+
+def _validate_function(function: Callable, spec: _FunctionSpec) -> ValidationResult:
+    """Validate a custom function's signature against the spec for its type."""
+    # Only signature inspection can fail (builtins and C callables may have none)
     try:
-        sig = inspect.signature(function)
-        params = list(sig.parameters.values())
-        
-        validation_points = []
-        
-        # Check: at least one parameter (ProcessingContext)
-        if len(params) == 0:
-            return ValidationResult(
-                valid=False,
-                message='Extractor must accept at least one parameter (ProcessingContext)',
-                parameters=[]
-            )
-        
-        # Check first parameter for ProcessingContext
-        first_param = params[0]
-        if _looks_like_context_param(first_param):
-            validation_points.append(f"✓ First parameter '{first_param.name}' appears to be ProcessingContext")
-        else:
-            validation_points.append(f"⚠ First parameter '{first_param.name}' should be ProcessingContext")
-        
-        # Check return annotation
-        if sig.return_annotation != sig.empty:
-            if 'dict' in str(sig.return_annotation).lower() or 'Dict' in str(sig.return_annotation):
-                validation_points.append("✓ Return type annotation indicates Dict")
-            else:
-                validation_points.append("⚠ Return type should be Dict[str, Any] (extracted fields)")
-        else:
-            validation_points.append("ℹ No return type annotation (should return Dict[str, Any])")
-        
-        # Get additional parameters for GUI input
-        additional_params = params[1:]
-        
-        # Build message
-        message = f"Extractor: {function.__name__}()\n" + "\n".join(validation_points)
-        message += "\n\nShould return: Dict with extracted field data"
-        
+        sig = _cached_signature(function)
+    except (TypeError, ValueError) as e:
         return ValidationResult(
-            valid=True,
-            message=message,
-            parameters=additional_params
+            valid=False,
+            message=f'Error inspecting {spec.error_name} function: {str(e)}',
+            parameters=[]
         )
-                
-    except Exception as e:
+    
+    # The first parameter is the context; the rest are collected for the GUI
+    param_iter = iter(sig.parameters.values())
+    first_param = next(param_iter, None)
+    
+    validation_points = []
+    
+    # Check: at least one parameter (ProcessingContext)
+    if first_param is None:
         return ValidationResult(
             valid=False,
-            message=f'Error inspecting extractor function: {str(e)}',
+            message=f'{spec.subject} must accept at least one parameter (ProcessingContext)',
             parameters=[]
         )
+    
+    # Check first parameter for ProcessingContext
+    if _looks_like_context_param(first_param):
+        validation_points.append(f"✓ First parameter '{first_param.name}' appears to be ProcessingContext")
+    else:
+        validation_points.append(f"⚠ First parameter '{first_param.name}' should be ProcessingContext")
+    
+    # Check return annotation; render it to text once for the keyword check
+    return_annotation = sig.return_annotation
+    if return_annotation is not sig.empty:
+        if spec.return_keyword in str(return_annotation).lower():
+            validation_points.append(f"✓ Return type annotation indicates {spec.return_type}")
+        else:
+            validation_points.append(f"⚠ Return type should be {spec.return_warning}")
+    else:
+        validation_points.append(f"ℹ No return type annotation (should return {spec.return_hint})")
+    
+    # Get additional parameters for GUI input
+    additional_params = list(param_iter)
+    
+    # Build message; callable objects have no __name__, so name their class
+    function_name = getattr(function, '__name__', type(function).__name__)
+    message = "\n".join((
+        f"{spec.label}: {function_name}()",
+        *validation_points,
+        "",
+        f"Should return: {spec.returns}"
+    ))
+    
+    return ValidationResult(
+        valid=True,
+        message=message,
+        parameters=additional_params
+    )
+
+def validate_extractor_function(function: Callable) -> ValidationResult:
+    """
+    Validate extractor function signature.
+    
+    Expected signature: def extract_data(context: ProcessingContext, *args, **kwargs) -> Dict[str, Any]
+    Expected return: Dictionary with extracted field data
+    """
+    return _validate_function(function, _EXTRACTOR_SPEC)
 
 
 def validate_converter_function(function: Callable) -> ValidationResult:
@@ -95,52 +198,7 @@ def validate_converter_function(function: Callable) -> ValidationResult:
     Expected signature: def convert_data(context: ProcessingContext, *args, **kwargs) -> Dict[str, Any]
     Expected return: Dictionary with converted/transformed field data
     """
-    try:
-        sig = inspect.signature(function)
-        params = list(sig.parameters.values())
-        
-        validation_points = []
-        
-        if len(params) == 0:
-            return ValidationResult(
-                valid=False,
-                message='Converter must accept at least one parameter (ProcessingContext)',
-                parameters=[]
-            )
-        
-        # Check first parameter for ProcessingContext
-        first_param = params[0]
-        if _looks_like_context_param(first_param):
-            validation_points.append(f"✓ First parameter '{first_param.name}' appears to be ProcessingContext")
-        else:
-            validation_points.append(f"⚠ First parameter '{first_param.name}' should be ProcessingContext")
-        
-        # Check return annotation
-        if sig.return_annotation != sig.empty:
-            if 'dict' in str(sig.return_annotation).lower() or 'Dict' in str(sig.return_annotation):
-                validation_points.append("✓ Return type annotation indicates Dict")
-            else:
-                validation_points.append("⚠ Return type should be Dict[str, Any] (transformed data)")
-        else:
-            validation_points.append("ℹ No return type annotation (should return Dict[str, Any])")
-        
-        additional_params = params[1:]
-        
-        message = f"Converter: {function.__name__}()\n" + "\n".join(validation_points)
-        message += "\n\nShould return: Dict with converted/transformed data"
-        
-        return ValidationResult(
-            valid=True,
-            message=message,
-            parameters=additional_params
-        )
-                
-    except Exception as e:
-        return ValidationResult(
-            valid=False,
-            message=f'Error inspecting converter function: {str(e)}',
-            parameters=[]
-        )
+    return _validate_function(function, _CONVERTER_SPEC)
 
 
 def validate_template_function(function: Callable) -> ValidationResult:
@@ -150,52 +208,7 @@ def validate_template_function(function: Callable) -> ValidationResult:
     Expected signature: def format_filename(context: ProcessingContext, *args, **kwargs) -> str
     Expected return: Formatted filename string (without extension)
     """
-    try:
-        sig = inspect.signature(function)
-        params = list(sig.parameters.values())
-        
-        validation_points = []
-        
-        if len(params) == 0:
-            return ValidationResult(
-                valid=False,
-                message='Template must accept at least one parameter (ProcessingContext)',
-                parameters=[]
-            )
-        
-        # Check first parameter for ProcessingContext
-        first_param = params[0]
-        if _looks_like_context_param(first_param):
-            validation_points.append(f"✓ First parameter '{first_param.name}' appears to be ProcessingContext")
-        else:
-            validation_points.append(f"⚠ First parameter '{first_param.name}' should be ProcessingContext")
-        
-        # Check return annotation
-        if sig.return_annotation != sig.empty:
-            if 'str' in str(sig.return_annotation).lower():
-                validation_points.append("✓ Return type annotation indicates str")
-            else:
-                validation_points.append("⚠ Return type should be str (formatted filename)")
-        else:
-            validation_points.append("ℹ No return type annotation (should return str)")
-        
-        additional_params = params[1:]
-        
-        message = f"Template: {function.__name__}()\n" + "\n".join(validation_points)
-        message += "\n\nShould return: str (formatted filename without extension)"
-        
-        return ValidationResult(
-            valid=True,
-            message=message,
-            parameters=additional_params
-        )
-                
-    except Exception as e:
-        return ValidationResult(
-            valid=False,
-            message=f'Error inspecting template function: {str(e)}',
-            parameters=[]
-        )
+    return _validate_function(function, _TEMPLATE_SPEC)
 
 
 def validate_filter_function(function: Callable) -> ValidationResult:
@@ -205,52 +218,7 @@ def validate_filter_function(function: Callable) -> ValidationResult:
     Expected signature: def filter_file(context: ProcessingContext, *args, **kwargs) -> bool
     Expected return: True if file should be processed, False to skip
     """
-    try:
-        sig = inspect.signature(function)
-        params = list(sig.parameters.values())
-        
-        validation_points = []
-        
-        if len(params) == 0:
-            return ValidationResult(
-                valid=False,
-                message='Filter must accept at least one parameter (ProcessingContext)',
-                parameters=[]
-            )
-        
-        # Check first parameter for ProcessingContext
-        first_param = params[0]
-        if _looks_like_context_param(first_param):
-            validation_points.append(f"✓ First parameter '{first_param.name}' appears to be ProcessingContext")
-        else:
-            validation_points.append(f"⚠ First parameter '{first_param.name}' should be ProcessingContext")
-        
-        # Check return annotation
-        if sig.return_annotation != sig.empty:
-            if 'bool' in str(sig.return_annotation).lower():
-                validation_points.append("✓ Return type annotation indicates bool")
-            else:
-                validation_points.append("⚠ Return type should be bool (True = process, False = skip)")
-        else:
-            validation_points.append("ℹ No return type annotation (should return bool)")
-        
-        additional_params = params[1:]
-        
-        message = f"Filter: {function.__name__}()\n" + "\n".join(validation_points)
-        message += "\n\nShould return: bool (True = process file, False = skip file)"
-        
-        return ValidationResult(
-            valid=True,
-            message=message,
-            parameters=additional_params
-        )
-                
-    except Exception as e:
-        return ValidationResult(
-            valid=False,
-            message=f'Error inspecting filter function: {str(e)}',
-            parameters=[]
-        )
+    return _validate_function(function, _FILTER_SPEC)
 
 
 def validate_allinone_function(function: Callable) -> ValidationResult:
@@ -260,52 +228,7 @@ def validate_allinone_function(function: Callable) -> ValidationResult:
     Expected signature: def process_file(context: ProcessingContext, *args, **kwargs) -> str
     Expected return: Formatted filename string (handles extraction + conversion + formatting)
     """
-    try:
-        sig = inspect.signature(function)
-        params = list(sig.parameters.values())
-        
-        validation_points = []
-        
-        if len(params) == 0:
-            return ValidationResult(
-                valid=False,
-                message='All-in-one function must accept at least one parameter (ProcessingContext)',
-                parameters=[]
-            )
-        
-        # Check first parameter for ProcessingContext
-        first_param = params[0]
-        if _looks_like_context_param(first_param):
-            validation_points.append(f"✓ First parameter '{first_param.name}' appears to be ProcessingContext")
-        else:
-            validation_points.append(f"⚠ First parameter '{first_param.name}' should be ProcessingContext")
-        
-        # Check return annotation
-        if sig.return_annotation != sig.empty:
-            if 'str' in str(sig.return_annotation).lower():
-                validation_points.append("✓ Return type annotation indicates str")
-            else:
-                validation_points.append("⚠ Return type should be str (formatted filename)")
-        else:
-            validation_points.append("ℹ No return type annotation (should return str)")
-        
-        additional_params = params[1:]
-        
-        message = f"All-in-One: {function.__name__}()\n" + "\n".join(validation_points)
-        message += "\n\nShould return: str (complete formatted filename without extension)"
-        
-        return ValidationResult(
-            valid=True,
-            message=message,
-            parameters=additional_params
-        )
-                
-    except Exception as e:
-        return ValidationResult(
-            valid=False,
-            message=f'Error inspecting all-in-one function: {str(e)}',
-            parameters=[]
-        )
+    return _validate_function(function, _ALLINONE_SPEC)
 
 
 # Function type mappings for easy access
@@ -331,7 +254,9 @@ def get_validator(function_type: str) -> Callable:
     Raises:
         ValueError: If function_type is not recognized
     """
-    if function_type not in FUNCTION_VALIDATORS:
-        raise ValueError(f"Unknown function type: {function_type}")
-    
-    return FUNCTION_VALIDATORS[function_type]
\ No newline at end of file
+    # The table holds the module-level validators, so each type always maps to
+    # the same function object
+    try:
+        return FUNCTION_VALIDATORS[function_type]
+    except KeyError:
+        raise ValueError(f"Unknown function type: {function_type}") from None
\ No newline at end of file
@@ -5,8 +5,12 @@ Test file generator for batch rename tool.
 Creates sample files with various naming patterns to test functionality.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Content for the large-file fixtures, allocated once and shared by every write
+LARGE_FILE_CONTENT = b"x" * (2 * 1024 * 1024)  # 2MB
+
 def create_test_files():
     """Create test files and directories."""
     
@@ -49,7 +53,8 @@ def create_test_files():
         "large_video.mp4",  # Will be large
     ]
     
-    # Create the actual files
+    # Collect (path, content) pairs; the files are written together below
+    files_to_write = []
     for filename in test_files:
         file_path = test_dir / filename
         
@@ -57,12 +62,11 @@ def create_test_files():
         if "small" in filename:
             content = b"small file content"
         elif "large" in filename or filename.endswith(".mp4"):
-            content = b"x" * (2 * 1024 * 1024)  # 2MB file
+            content = LARGE_FILE_CONTENT
         else:
             content = f"Test content for {filename}".encode()
         
-        file_path.write_bytes(content)
-        print(f"Created: {file_path}")
+        files_to_write.append((file_path, content))
     
     # Create some files in subdirectories for recursive testing
     subdir_files = [
@@ -75,8 +79,14 @@ def create_test_files():
     for subdir, filename in subdir_files:
         file_path = test_dir / subdir / filename
         content = f"Test content for {filename} in {subdir}".encode()
-        file_path.write_bytes(content)
-        print(f"Created: {file_path}")
+        files_to_write.append((file_path, content))
+    
+    # Write the files concurrently (directories already exist), then report
+    # them in order with a single write once every file has finished
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda item: item[0].write_bytes(item[1]), files_to_write))
+    
+    print("\n".join(f"Created: {file_path}" for file_path, _ in files_to_write))
     
     print(f"\nTest setup complete! Created {len(test_files)} files in test_files/")
     print("Plus additional files in subdirectories for recursive testing.")
@@ -8,7 +8,8 @@ Updated to use ProcessingContext data class.
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+import functools
 import re
 import datetime
 import hashlib
@@ -29,6 +30,135 @@ except ImportError:
         extracted_data: Dict[str, Any] = None
 
 
+# Patterns are compiled once at import rather than looked up on every call
+_INVOICE_PATTERNS = [
+    re.compile(r'Invoice[_-](\d+)[_-]([^_-]+)(?:[_-](\d{4}-\d{2}-\d{2}))?', re.IGNORECASE),
+    re.compile(r'INV[_-](\d+)[_-]([^_-]+)', re.IGNORECASE),
+    re.compile(r'(\d+)[_-]Invoice[_-]([^_-]+)', re.IGNORECASE)
+]
+# Legal suffixes and special characters (except hyphens) are removed in one pass
+_COMPANY_NOISE_RE = re.compile(r'(?i:\b(?:inc|ltd|llc|corp|co)\b)|[^\w\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_DATE8_RE = re.compile(r'(\d{8})')
+_TIME6_RE = re.compile(r'(\d{6})')
+_DEVICE_PATTERNS = [
+    re.compile(r'^(IMG|DSC|DCIM|P\d+)_', re.IGNORECASE),
+    re.compile(r'(iPhone|Samsung|Pixel|Canon|Nikon|Sony)', re.IGNORECASE)
+]
+
+_VERSION_PATTERNS = [
+    re.compile(r'[vV](\d+)\.(\d+)'), re.compile(r'[vV](\d+)'),
+    re.compile(r'_(\d+)\.(\d+)_'), re.compile(r'_(\d+)_'),
+    re.compile(r'rev(\d+)'), re.compile(r'r(\d+)')
+]
+_DATE_PATTERNS = [
+    re.compile(r'(\d{4}[-_]\d{2}[-_]\d{2})'),
+    re.compile(r'(\d{8})'),
+    re.compile(r'(\d{2}[-_]\d{2}[-_]\d{4})')
+]
+_SEPARATOR_RUN_RE = re.compile(r'[_\-\.]+')
+
+_MEDIA_NAME_NOISE_RE = re.compile(r'[\d_\-\.]+')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+# Lookup tables, built once at import
+_DEPT_MAP = {
+    'HR': 'Human-Resources',
+    'IT': 'Information-Technology',
+    'FIN': 'Finance',
+    'LEGAL': 'Legal',
+    'OPS': 'Operations',
+    'SALES': 'Sales',
+    'MKT': 'Marketing'
+}
+
+_TYPE_MAP = {
+    'POLICY': 'Policy',
+    'PROCEDURE': 'Procedure',
+    'REPORT': 'Report',
+    'MEETING': 'Meeting-Notes',
+    'CONTRACT': 'Contract',
+    'INVOICE': 'Invoice',
+    'PROPOSAL': 'Proposal'
+}
+
+# Checked in order; the first status with a keyword in the name wins
+_STATUS_KEYWORDS = {
+    'draft': ('draft', 'wip', 'work'),
+    'review': ('review', 'rev', 'check'),
+    'final': ('final', 'approved', 'delivery'),
+    'archive': ('old', 'archive', 'backup')
+}
+
+# Media type by lowercase file extension
+_EXT_TO_MEDIA_TYPE = {
+    **dict.fromkeys(('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'), 'Image'),
+    **dict.fromkeys(('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'), 'Video'),
+    **dict.fromkeys(('.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a'), 'Audio')
+}
+
+
+# Files are hashed through one reusable buffer of this size
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Bytes read from each end of a file when hash_mode is "sample"
+_HASH_SAMPLE_SIZE = 64 * 1024
+
+
+# Each example script must load standalone, so this helper is copied; tests keep the copies identical
+def _parse_yyyymmdd(date_str: str) -> datetime.datetime:
+    """Parse a YYYYMMDD string like strptime(date_str, '%Y%m%d'), skipping its format parser for plain digits."""
+    if len(date_str) == 8 and date_str.isascii() and date_str.isdigit():
+        return datetime.datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+    return datetime.datetime.strptime(date_str, '%Y%m%d')
+
+
+# Each example script must load standalone, so this helper is copied; tests keep the copies identical
+@functools.lru_cache(maxsize=32)
+def _parse_client_list(client_list: str) -> Tuple[Tuple[str, str], ...]:
+    """Split a comma-separated client list into (name, lowercased name) pairs, in list order."""
+    if not client_list:
+        return ()
+    clients = (c.strip() for c in client_list.split(','))
+    return tuple((c, c.lower()) for c in clients)
+
+
+def _hash_file(path: Path) -> str:
+    """Return the MD5 hex digest of a file, streamed in fixed-size chunks."""
+    digest = hashlib.md5()
+    buffer = bytearray(_HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+def _hash_file_sample(path: Path) -> str:
+    """Return an 8-character BLAKE2b hex digest of a file's size and its first and last windows."""
+    size = path.stat().st_size
+    digest = hashlib.blake2b(size.to_bytes(8, 'little'), digest_size=4)
+    with open(path, 'rb') as f:
+        digest.update(f.read(_HASH_SAMPLE_SIZE))
+        if size > 2 * _HASH_SAMPLE_SIZE:
+            f.seek(-_HASH_SAMPLE_SIZE, 2)
+            digest.update(f.read(_HASH_SAMPLE_SIZE))
+        elif size > _HASH_SAMPLE_SIZE:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# Duplicate-tag hash functions by hash_mode
+_HASH_MODES = {
+    'full': _hash_file,
+    'sample': _hash_file_sample
+}
+
+
 def process_business_documents(context: ProcessingContext, department_mapping: bool = True, 
                              include_year: bool = False) -> str:
     """
@@ -46,7 +176,7 @@ def process_business_documents(context: ProcessingContext, department_mapping: b
     base_name = context.file_path.stem
     
     # Extract data from filename
-    parts = base_name.split('_')
+    parts = base_name.split('_', 3)
     
     if len(parts) >= 3:
         dept, doc_type, date = parts[0], parts[1], parts[2]
@@ -57,45 +187,24 @@ def process_business_documents(context: ProcessingContext, department_mapping: b
     
     # Apply department mapping
     if department_mapping:
-        dept_map = {
-            'HR': 'Human-Resources',
-            'IT': 'Information-Technology',
-            'FIN': 'Finance',
-            'LEGAL': 'Legal',
-            'OPS': 'Operations',
-            'SALES': 'Sales',
-            'MKT': 'Marketing'
-        }
-        dept = dept_map.get(dept.upper(), dept.title())
+        dept = _DEPT_MAP.get(dept.upper(), dept.title())
     
     # Format document type
-    type_map = {
-        'POLICY': 'Policy',
-        'PROCEDURE': 'Procedure',
-        'REPORT': 'Report',
-        'MEETING': 'Meeting-Notes',
-        'CONTRACT': 'Contract',
-        'INVOICE': 'Invoice',
-        'PROPOSAL': 'Proposal'
-    }
-    doc_type = type_map.get(doc_type.upper(), doc_type.title())
+    doc_type = _TYPE_MAP.get(doc_type.upper(), doc_type.title())
     
     # Format date
     if date != 'unknown':
         try:
             if len(date) == 8:  # YYYYMMDD
-                parsed_date = datetime.datetime.strptime(date, '%Y%m%d')
+                parsed_date = _parse_yyyymmdd(date)
                 date = parsed_date.strftime('%Y-%m-%d')
         except ValueError:
             pass  # Keep original if parsing fails
     
     # Build final filename
     if include_year and date != 'unknown':
-        try:
-            year = date[:4]
-            return f"{year}_{dept}_{doc_type}_{date}"
-        except:
-            pass
+        year = date[:4]
+        return f"{year}_{dept}_{doc_type}_{date}"
     
     if date != 'unknown':
         return f"{dept}_{doc_type}_{date}"
@@ -120,16 +229,10 @@ def process_invoices(context: ProcessingContext, company_prefix: bool = True,
     base_name = context.file_path.stem
     
     # Extract invoice data using patterns
-    patterns = [
-        r'Invoice[_-](\d+)[_-]([^_-]+)(?:[_-](\d{4}-\d{2}-\d{2}))?',
-        r'INV[_-](\d+)[_-]([^_-]+)',
-        r'(\d+)[_-]Invoice[_-]([^_-]+)'
-    ]
-    
     number, company, date = 'unknown', 'unknown', 'unknown'
     
-    for pattern in patterns:
-        match = re.search(pattern, base_name, re.IGNORECASE)
+    for pattern in _INVOICE_PATTERNS:
+        match = pattern.search(base_name)
         if match:
             if len(match.groups()) == 3:
                 number, company, date = match.groups()
@@ -140,9 +243,8 @@ def process_invoices(context: ProcessingContext, company_prefix: bool = True,
     
     # Clean company name
     if company != 'unknown':
-        company = re.sub(r'\b(inc|ltd|llc|corp|co)\b', '', company, flags=re.IGNORECASE)
-        company = re.sub(r'[^\w\s-]', '', company)
-        company = re.sub(r'\s+', '-', company.strip()).title()
+        company = _COMPANY_NOISE_RE.sub('', company)
+        company = _WHITESPACE_RE.sub('-', company.strip()).title()
     else:
         company = 'Unknown-Company'
     
@@ -170,7 +272,8 @@ def process_invoices(context: ProcessingContext, company_prefix: bool = True,
 
 
 def process_photos(context: ProcessingContext, organize_by_month: bool = True,
-                  include_device: bool = False, hash_duplicates: bool = False) -> str:
+                  include_device: bool = False, hash_duplicates: bool = False,
+                  hash_mode: str = "full") -> str:
     """
     All-in-one photo processor.
     
@@ -180,18 +283,20 @@ def process_photos(context: ProcessingContext, organize_by_month: bool = True,
         organize_by_month: Whether to include YYYY-MM prefix for monthly organization
         include_device: Whether to include device/camera info in filename
         hash_duplicates: Whether to add hash suffix to prevent duplicate names
+        hash_mode: "full" hashes the whole file; "sample" hashes only its size and
+            first/last 64 KiB, which is much faster for large files
     
     Returns:
         Formatted photo filename string
     """
+    if hash_mode not in _HASH_MODES:
+        raise ValueError(f"hash_mode must be one of {sorted(_HASH_MODES)}, got '{hash_mode}'")
+    
     base_name = context.file_path.stem
     
     # Extract date from filename or metadata
-    date_pattern = r'(\d{8})'
-    time_pattern = r'(\d{6})'
-    
-    date_match = re.search(date_pattern, base_name)
-    time_match = re.search(time_pattern, base_name)
+    date_match = _DATE8_RE.search(base_name)
+    time_match = _TIME6_RE.search(base_name)
     
     components = []
     
@@ -199,7 +304,7 @@ def process_photos(context: ProcessingContext, organize_by_month: bool = True,
     if date_match:
         date_str = date_match.group(1)
         try:
-            parsed_date = datetime.datetime.strptime(date_str, '%Y%m%d')
+            parsed_date = _parse_yyyymmdd(date_str)
             if organize_by_month:
                 components.append(parsed_date.strftime('%Y-%m'))
             components.append(parsed_date.strftime('%Y%m%d'))
@@ -213,7 +318,7 @@ def process_photos(context: ProcessingContext, organize_by_month: bool = True,
             if organize_by_month:
                 components.append(mod_time.strftime('%Y-%m'))
             components.append(mod_time.strftime('%Y%m%d'))
-        except:
+        except (OSError, OverflowError, ValueError):
             components.append('unknown-date')
     
     # Time component
@@ -223,13 +328,8 @@ def process_photos(context: ProcessingContext, organize_by_month: bool = True,
     
     # Device component
     if include_device:
-        device_patterns = [
-            r'^(IMG|DSC|DCIM|P\d+)_',
-            r'(iPhone|Samsung|Pixel|Canon|Nikon|Sony)'
-        ]
-        
-        for pattern in device_patterns:
-            match = re.search(pattern, base_name, re.IGNORECASE)
+        for pattern in _DEVICE_PATTERNS:
+            match = pattern.search(base_name)
             if match:
                 components.append(match.group(1))
                 break
@@ -237,9 +337,10 @@ def process_photos(context: ProcessingContext, organize_by_month: bool = True,
             components.append('Camera')
     
     # Photo type
-    if 'VID' in base_name.upper():
+    base_upper = base_name.upper()
+    if 'VID' in base_upper:
         components.append('Video')
-    elif 'SCR' in base_name.upper() or 'Screenshot' in base_name:
+    elif 'SCR' in base_upper or 'Screenshot' in base_name:
         components.append('Screenshot')
     else:
         components.append('Photo')
@@ -247,10 +348,9 @@ def process_photos(context: ProcessingContext, organize_by_month: bool = True,
     # Hash for duplicates
     if hash_duplicates:
         try:
-            with open(context.file_path, 'rb') as f:
-                file_hash = hashlib.md5(f.read()).hexdigest()[:8]
+            file_hash = _HASH_MODES[hash_mode](context.file_path)[:8]
             components.append(file_hash)
-        except:
+        except OSError:
             pass  # Skip hash if file can't be read
     
     return '_'.join(components)
@@ -273,28 +373,20 @@ def process_project_files(context: ProcessingContext, client_list: str = "",
     """
     base_name = context.file_path.stem
     
-    # Parse client list
-    known_clients = []
-    if client_list:
-        known_clients = [c.strip() for c in client_list.split(',')]
+    # Lowercase the name once for the client and status checks
+    base_lower = base_name.lower()
     
     # Extract client
     client = 'unknown'
-    for c in known_clients:
-        if c.lower() in base_name.lower():
+    for c, c_lower in _parse_client_list(client_list):
+        if c_lower in base_lower:
             client = c.replace(' ', '-')
             break
     
     # Extract version
-    version_patterns = [
-        r'[vV](\d+)\.(\d+)', r'[vV](\d+)',
-        r'_(\d+)\.(\d+)_', r'_(\d+)_',
-        r'rev(\d+)', r'r(\d+)'
-    ]
-    
     version = 'unknown'
-    for pattern in version_patterns:
-        match = re.search(pattern, base_name)
+    for pattern in _VERSION_PATTERNS:
+        match = pattern.search(base_name)
         if match:
             if len(match.groups()) == 2:
                 version = f"{match.group(1)}.{match.group(2)}"
@@ -303,29 +395,16 @@ def process_project_files(context: ProcessingContext, client_list: str = "",
             break
     
     # Extract status
-    status_keywords = {
-        'draft': ['draft', 'wip', 'work'],
-        'review': ['review', 'rev', 'check'],
-        'final': ['final', 'approved', 'delivery'],
-        'archive': ['old', 'archive', 'backup']
-    }
-    
     status = 'unknown'
-    for status_name, keywords in status_keywords.items():
-        if any(keyword in base_name.lower() for keyword in keywords):
+    for status_name, keywords in _STATUS_KEYWORDS.items():
+        if any(keyword in base_lower for keyword in keywords):
             status = status_name
             break
     
     # Extract date
-    date_patterns = [
-        r'(\d{4}[-_]\d{2}[-_]\d{2})',
-        r'(\d{8})',
-        r'(\d{2}[-_]\d{2}[-_]\d{4})'
-    ]
-    
     date = 'unknown'
-    for pattern in date_patterns:
-        match = re.search(pattern, base_name)
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(base_name)
         if match:
             date = match.group(1).replace('-', '').replace('_', '')
             break
@@ -336,7 +415,7 @@ def process_project_files(context: ProcessingContext, client_list: str = "",
         if remove_item != 'unknown':
             project_name = project_name.replace(remove_item, '')
     
-    project_name = re.sub(r'[_\-\.]+', '_', project_name).strip('_-.')
+    project_name = _SEPARATOR_RUN_RE.sub('_', project_name).strip('_-.')
     if not project_name:
         project_name = 'Project'
     
@@ -382,21 +461,11 @@ def process_media_files(context: ProcessingContext, categorize_by_type: bool = T
     file_ext = context.file_path.suffix.lower()
     
     # Determine media type
-    image_exts = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp']
-    video_exts = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm']
-    audio_exts = ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a']
-    
-    media_type = 'Unknown'
-    if file_ext in image_exts:
-        media_type = 'Image'
-    elif file_ext in video_exts:
-        media_type = 'Video'
-    elif file_ext in audio_exts:
-        media_type = 'Audio'
+    media_type = _EXT_TO_MEDIA_TYPE.get(file_ext, 'Unknown')
     
     # Extract date/time if present
-    date_match = re.search(r'(\d{8})', base_name)
-    time_match = re.search(r'(\d{6})', base_name)
+    date_match = _DATE8_RE.search(base_name)
+    time_match = _TIME6_RE.search(base_name)
     
     components = []
     
@@ -418,8 +487,8 @@ def process_media_files(context: ProcessingContext, categorize_by_type: bool = T
         components.append('HD')  # Placeholder
     
     # Original name component (cleaned)
-    clean_name = re.sub(r'[\d_\-\.]+', '', base_name)
-    clean_name = re.sub(r'[^\w\s]', '', clean_name).strip()
+    clean_name = _MEDIA_NAME_NOISE_RE.sub('', base_name)
+    clean_name = _NON_WORD_RE.sub('', clean_name).strip()
     if clean_name and len(clean_name) > 3:
         components.append(clean_name.title())
     
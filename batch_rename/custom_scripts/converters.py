@@ -28,6 +28,45 @@ except ImportError:
         extracted_data: Dict[str, Any] = None
 
 
+# Company-name cleanup patterns, compiled once at import
+# Legal suffixes and special characters (except hyphens) are removed in one pass
+_COMPANY_NOISE_RE = re.compile(r'(?i:\b(?:inc|ltd|llc|corp|co)\b)|[^\w\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Department and document-type display names, built once at import
+_DEPT_MAP = {
+    'HR': 'Human-Resources',
+    'IT': 'Information-Technology',
+    'FIN': 'Finance',
+    'FINANCE': 'Finance',
+    'LEGAL': 'Legal',
+    'OPS': 'Operations',
+    'OPERATIONS': 'Operations',
+    'SALES': 'Sales',
+    'MARKETING': 'Marketing',
+    'MKT': 'Marketing'
+}
+
+_TYPE_MAP = {
+    'POLICY': 'Policy',
+    'PROCEDURE': 'Procedure',
+    'REPORT': 'Report',
+    'MEETING': 'Meeting-Notes',
+    'CONTRACT': 'Contract',
+    'INVOICE': 'Invoice',
+    'PROPOSAL': 'Proposal',
+    'PRESENTATION': 'Presentation'
+}
+
+
+# Each example script must load standalone, so this helper is copied; tests keep the copies identical
+def _parse_yyyymmdd(date_str: str) -> datetime.datetime:
+    """Parse a YYYYMMDD string like strptime(date_str, '%Y%m%d'), skipping its format parser for plain digits."""
+    if len(date_str) == 8 and date_str.isascii() and date_str.isdigit():
+        return datetime.datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+    return datetime.datetime.strptime(date_str, '%Y%m%d')
+
+
 def convert_data(context: ProcessingContext) -> Dict[str, Any]:
     """
     Business document formatter.
@@ -39,46 +78,22 @@ def convert_data(context: ProcessingContext) -> Dict[str, Any]:
         Dictionary with formatted fields including dept_full, type_formatted, date_iso, formatted_name
     """
     if not context.has_extracted_data():
-        return {'formatted_name': context.file_path.stem}
+        return {'formatted_name': context.base_name}
     
     result = context.extracted_data.copy()
     
     # Standardize department codes
-    dept_mapping = {
-        'HR': 'Human-Resources',
-        'IT': 'Information-Technology', 
-        'FIN': 'Finance',
-        'FINANCE': 'Finance',
-        'LEGAL': 'Legal',
-        'OPS': 'Operations',
-        'OPERATIONS': 'Operations',
-        'SALES': 'Sales',
-        'MARKETING': 'Marketing',
-        'MKT': 'Marketing'
-    }
-    
     dept = context.get_extracted_field('dept')
     if dept:
         dept_upper = dept.upper()
-        result['dept_full'] = dept_mapping.get(dept_upper, dept.title())
+        result['dept_full'] = _DEPT_MAP.get(dept_upper, dept.title())
         result['dept_code'] = dept_upper
     
     # Standardize document types
-    type_mapping = {
-        'POLICY': 'Policy',
-        'PROCEDURE': 'Procedure', 
-        'REPORT': 'Report',
-        'MEETING': 'Meeting-Notes',
-        'CONTRACT': 'Contract',
-        'INVOICE': 'Invoice',
-        'PROPOSAL': 'Proposal',
-        'PRESENTATION': 'Presentation'
-    }
-    
     doc_type = context.get_extracted_field('type')
     if doc_type:
         type_upper = doc_type.upper()
-        result['type_formatted'] = type_mapping.get(type_upper, doc_type.title())
+        result['type_formatted'] = _TYPE_MAP.get(type_upper, doc_type.title())
     
     # Format date consistently
     date_str = context.get_extracted_field('date')
@@ -86,7 +101,7 @@ def convert_data(context: ProcessingContext) -> Dict[str, Any]:
         # Try to parse various date formats
         try:
             if len(date_str) == 8:  # YYYYMMDD
-                parsed_date = datetime.datetime.strptime(date_str, '%Y%m%d')
+                parsed_date = _parse_yyyymmdd(date_str)
             elif '-' in date_str:  # YYYY-MM-DD
                 parsed_date = datetime.datetime.strptime(date_str, '%Y-%m-%d')
             else:
@@ -107,7 +122,7 @@ def convert_data(context: ProcessingContext) -> Dict[str, Any]:
     elif all(k in result for k in ['dept_full', 'type_formatted']):
         result['formatted_name'] = f"{result['dept_full']}_{result['type_formatted']}"
     else:
-        result['formatted_name'] = context.file_path.stem
+        result['formatted_name'] = context.base_name
     
     return result
 
@@ -125,7 +140,7 @@ def convert_invoice_data(context: ProcessingContext, company_prefix: bool = True
         Dictionary with formatted invoice fields including company_clean, number_padded, formatted_name
     """
     if not context.has_extracted_data():
-        return {'formatted_name': context.file_path.stem}
+        return {'formatted_name': context.base_name}
     
     result = context.extracted_data.copy()
     
@@ -133,9 +148,8 @@ def convert_invoice_data(context: ProcessingContext, company_prefix: bool = True
     company = context.get_extracted_field('company')
     if company and company != 'unknown':
         # Remove common suffixes and clean
-        company = re.sub(r'\b(inc|ltd|llc|corp|co)\b', '', company, flags=re.IGNORECASE)
-        company = re.sub(r'[^\w\s-]', '', company)  # Remove special chars except hyphens
-        company = re.sub(r'\s+', '-', company.strip())  # Replace spaces with hyphens
+        company = _COMPANY_NOISE_RE.sub('', company)  # Remove suffixes and special chars except hyphens
+        company = _WHITESPACE_RE.sub('-', company.strip())  # Replace spaces with hyphens
         result['company_clean'] = company.title()
     else:
         result['company_clean'] = 'Unknown-Company'
@@ -195,7 +209,7 @@ def convert_photo_data(context: ProcessingContext, include_device: bool = False,
         Dictionary with formatted photo fields including organized folder structure and clean filename
     """
     if not context.has_extracted_data():
-        return {'formatted_name': context.file_path.stem}
+        return {'formatted_name': context.base_name}
     
     result = context.extracted_data.copy()
     
@@ -209,12 +223,12 @@ def convert_photo_data(context: ProcessingContext, include_device: bool = False,
             # Create YYYY-MM format for folder organization
             try:
                 if '-' in date_str:
-                    year_month = '-'.join(date_str.split('-')[:2])  # YYYY-MM
+                    year_month = '-'.join(date_str.split('-', 2)[:2])  # YYYY-MM
                 else:
                     year_month = f"{date_str[:4]}-{date_str[4:6]}"  # YYYYMMDD -> YYYY-MM
                 result['folder_date'] = year_month
                 components.append(date_str.replace('-', ''))  # YYYYMMDD for filename
-            except:
+            except (TypeError, AttributeError):
                 components.append(date_str)
         else:
             components.append(date_str.replace('-', ''))
@@ -239,7 +253,7 @@ def convert_photo_data(context: ProcessingContext, include_device: bool = False,
     if components:
         result['formatted_name'] = '_'.join(components)
     else:
-        result['formatted_name'] = context.file_path.stem
+        result['formatted_name'] = context.base_name
     
     # Add folder organization info
     if group_by_month and 'folder_date' in result:
@@ -270,7 +284,7 @@ def convert_project_data(context: ProcessingContext, use_client_prefix: bool = T
         Dictionary with formatted project fields including organized filename and folder structure
     """
     if not context.has_extracted_data():
-        return {'formatted_name': context.file_path.stem}
+        return {'formatted_name': context.base_name}
     
     result = context.extracted_data.copy()
     
@@ -354,7 +368,7 @@ def convert_document_data(context: ProcessingContext, department_folders: bool =
         Dictionary with formatted document fields including folder structure and length-limited filename
     """
     if not context.has_extracted_data():
-        return {'formatted_name': context.file_path.stem[:max_filename_length]}
+        return {'formatted_name': context.base_name[:max_filename_length]}
     
     result = context.extracted_data.copy()
     
@@ -384,7 +398,7 @@ def convert_document_data(context: ProcessingContext, department_folders: bool =
             filename = filename[:max_filename_length-3] + '...'
         result['formatted_name'] = filename
     else:
-        original = context.file_path.stem
+        original = context.base_name
         result['formatted_name'] = original[:max_filename_length]
     
     # Build folder structure
@@ -398,12 +412,12 @@ def convert_document_data(context: ProcessingContext, department_folders: bool =
     if date_folders and date_str and date_str != 'unknown':
         try:
             if '-' in date_str:
-                date_parts = date_str.split('-')
+                date_parts = date_str.split('-', 2)
                 folder_parts.extend([date_parts[0], date_parts[1]])  # YYYY/MM
             elif len(date_str) >= 6:
                 folder_parts.extend([date_str[:4], date_str[4:6]])  # YYYY/MM
-        except:
-            pass  # Skip date folders if parsing fails
+        except (TypeError, AttributeError):
+            pass  # Skip date folders if the date isn't a string
     
     # Document type folder
     if doc_type and doc_type != 'unknown':
@@ -8,7 +8,8 @@ Updated to use ProcessingContext data class.
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+import functools
 import re
 import datetime
 import sys
@@ -28,6 +29,33 @@ except ImportError:
         extracted_data: Dict[str, Any] = None
 
 
+# Status keywords, checked in order; the first status with a keyword in the name wins
+_STATUS_KEYWORDS = {
+    'draft': ('draft', 'wip', 'work'),
+    'review': ('review', 'rev', 'check'),
+    'final': ('final', 'approved', 'delivery'),
+    'archive': ('old', 'archive', 'backup')
+}
+
+
+# Each example script must load standalone, so this helper is copied; tests keep the copies identical
+def _parse_yyyymmdd(date_str: str) -> datetime.datetime:
+    """Parse a YYYYMMDD string like strptime(date_str, '%Y%m%d'), skipping its format parser for plain digits."""
+    if len(date_str) == 8 and date_str.isascii() and date_str.isdigit():
+        return datetime.datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+    return datetime.datetime.strptime(date_str, '%Y%m%d')
+
+
+# Each example script must load standalone, so this helper is copied; tests keep the copies identical
+@functools.lru_cache(maxsize=32)
+def _parse_client_list(client_list: str) -> Tuple[Tuple[str, str], ...]:
+    """Split a comma-separated client list into (name, lowercased name) pairs, in list order."""
+    if not client_list:
+        return ()
+    clients = (c.strip() for c in client_list.split(','))
+    return tuple((c, c.lower()) for c in clients)
+
+
 def extract_data(context: ProcessingContext) -> Dict[str, str]:
     """
     Simple business document extractor.
@@ -41,7 +69,7 @@ def extract_data(context: ProcessingContext) -> Dict[str, str]:
     base_name = context.file_path.stem
     
     # Split on underscores and extract known positions
-    parts = base_name.split('_')
+    parts = base_name.split('_', 3)
     
     result = {}
     if len(parts) >= 3:
@@ -143,7 +171,7 @@ def extract_photo_data(context: ProcessingContext, include_location: bool = Fals
     if date_match:
         date_str = date_match.group(1)
         try:
-            parsed_date = datetime.datetime.strptime(date_str, '%Y%m%d')
+            parsed_date = _parse_yyyymmdd(date_str)
             result['date'] = parsed_date.strftime('%Y-%m-%d')
             result['year'] = parsed_date.strftime('%Y')
             result['month'] = parsed_date.strftime('%m')
@@ -159,7 +187,7 @@ def extract_photo_data(context: ProcessingContext, include_location: bool = Fals
             result['year'] = mod_time.strftime('%Y')
             result['month'] = mod_time.strftime('%m')
             result['day'] = mod_time.strftime('%d')
-        except:
+        except (OSError, OverflowError, ValueError):
             result['date'] = 'unknown'
     
     if time_match:
@@ -196,11 +224,12 @@ def extract_photo_data(context: ProcessingContext, include_location: bool = Fals
         result['country'] = 'unknown'
     
     # Determine photo type
-    if 'IMG' in base_name.upper():
+    base_upper = base_name.upper()
+    if 'IMG' in base_upper:
         result['type'] = 'Photo'
-    elif 'VID' in base_name.upper():
+    elif 'VID' in base_upper:
         result['type'] = 'Video'
-    elif 'SCR' in base_name.upper() or 'Screenshot' in base_name:
+    elif 'SCR' in base_upper or 'Screenshot' in base_name:
         result['type'] = 'Screenshot'
     else:
         result['type'] = 'Media'
@@ -226,15 +255,13 @@ def extract_project_data(context: ProcessingContext, client_list: str = "",
     base_name = context.file_path.stem
     result = {}
     
-    # Parse client list if provided
-    known_clients = []
-    if client_list:
-        known_clients = [c.strip() for c in client_list.split(',')]
+    # Lowercase the name once for the client and status checks
+    base_lower = base_name.lower()
     
     # Try to identify client from known list
     result['client'] = 'unknown'
-    for client in known_clients:
-        if client.lower() in base_name.lower():
+    for client, client_lower in _parse_client_list(client_list):
+        if client_lower in base_lower:
             result['client'] = client
             break
     
@@ -261,16 +288,9 @@ def extract_project_data(context: ProcessingContext, client_list: str = "",
             result['version'] = 'unknown'
     
     # Extract status indicators
-    status_keywords = {
-        'draft': ['draft', 'wip', 'work'],
-        'review': ['review', 'rev', 'check'],
-        'final': ['final', 'approved', 'delivery'],
-        'archive': ['old', 'archive', 'backup']
-    }
-    
     result['status'] = 'unknown'
-    for status, keywords in status_keywords.items():
-        if any(keyword in base_name.lower() for keyword in keywords):
+    for status, keywords in _STATUS_KEYWORDS.items():
+        if any(keyword in base_lower for keyword in keywords):
             result['status'] = status
             break
     
@@ -75,7 +75,7 @@ def format_business_filename(context: ProcessingContext) -> str:
                 formatted_date = date_obj.strftime('%Y-%m-%d')
             else:
                 formatted_date = date_str
-        except:
+        except (ValueError, TypeError):
             formatted_date = date_str
     else:
         formatted_date = datetime.datetime.now().strftime('%Y-%m-%d')
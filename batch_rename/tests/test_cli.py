@@ -116,13 +116,23 @@ class TestArgumentParser:
         expected_args = {
             'help', 'config', 'input_folder', 'recursive',
             'extractor', 'converter', 'template', 'filter',
-            'extract_and_convert', 'preview', 'execute'
+            'extract_and_convert', 'preview', 'execute', 'workers'
         }
         
         # Verify expected arguments are present
         missing_args = expected_args - actions
         assert not missing_args, f"Missing expected arguments: {missing_args}"
     
+    def test_parser_rejects_non_positive_workers(self):
+        """Test that --workers below 1 is an argument error."""
+        parser = create_argument_parser()
+        
+        assert parser.parse_args(['--workers', '3']).workers == 3
+        assert parser.parse_args([]).workers is None
+        for value in ('0', '-2', 'many'):
+            with pytest.raises(SystemExit):
+                parser.parse_args(['--workers', value])
+    
     def test_parser_help_generation(self):
         """Test that parser can generate help without errors."""
         parser = create_argument_parser()
@@ -157,6 +167,7 @@ class TestConfigurationCreation:
         mock_args.execute = False
         mock_args.on_existing_collision = 'skip'
         mock_args.on_internal_collision = 'error'
+        mock_args.workers = None
         
         config = create_config_from_cli_args(mock_args)
         
@@ -206,6 +217,7 @@ class TestConfigurationCreation:
         mock_args.execute = False
         mock_args.on_existing_collision = 'skip'
         mock_args.on_internal_collision = 'error'
+        mock_args.workers = None
         
         config = create_config_from_cli_args(mock_args)
         
@@ -227,6 +239,7 @@ class TestConfigurationCreation:
         mock_args.execute = False
         mock_args.on_existing_collision = 'skip'
         mock_args.on_internal_collision = 'error'
+        mock_args.workers = None
         
         config = create_config_from_cli_args(mock_args)
         
@@ -248,6 +261,7 @@ class TestConfigurationCreation:
         mock_args.execute = False
         mock_args.on_existing_collision = 'skip'
         mock_args.on_internal_collision = 'error'
+        mock_args.workers = None
         
         config = create_config_from_cli_args(mock_args)
         
@@ -2,6 +2,7 @@
 Unit tests for configuration classes and validation.
 """
 
+import sys
 import pytest
 from pathlib import Path
 
@@ -150,6 +151,16 @@ class TestRenameConfigValidation:
             )
             assert config.template['name'] == template_name
     
+    @pytest.mark.parametrize("workers", [0, -2, "4", None, True, 1.5])
+    def test_invalid_workers(self, temp_dir, workers):
+        """Test validation rejects worker counts that are not integers >= 1."""
+        with pytest.raises(ValueError, match="workers must be an integer >= 1"):
+            RenameConfig(
+                input_folder=temp_dir,
+                extractor="split",
+                workers=workers
+            )
+    
     def test_custom_template_file(self, temp_dir):
         """Test validation accepts custom .py template files."""
         config = RenameConfig(
@@ -234,6 +245,15 @@ class TestRenameResultCreation:
         assert result.preview_data == []
         assert result.error_details == []
     
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_result_has_no_instance_dict(self):
+        """Test that results are slotted and reject unknown attributes."""
+        result = RenameResult()
+        
+        assert not hasattr(result, '__dict__')
+        with pytest.raises(AttributeError):
+            result.unknown_field = 1
+    
     def test_result_with_values(self):
         """Test RenameResult with specific values."""
         preview_data = [
@@ -0,0 +1,164 @@
+"""
+Unit tests for configuration file loading.
+"""
+
+import json
+import os
+import pytest
+
+from batch_rename.config.config_loader import ConfigLoader
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Ensure each test starts with an empty config cache."""
+    ConfigLoader.clear_cache()
+    yield
+    ConfigLoader.clear_cache()
+
+
+class TestLoadConfigFile:
+    """Test loading raw configuration data from disk."""
+    
+    def test_load_yaml(self, temp_dir):
+        """Test loading a YAML configuration file."""
+        config_path = temp_dir / "config.yaml"
+        config_path.write_text("settings:\n  recursive: true\n", encoding='utf-8')
+        
+        data = ConfigLoader.load_config_file(config_path)
+        
+        assert data == {'settings': {'recursive': True}}
+    
+    def test_load_json(self, temp_dir):
+        """Test loading a JSON configuration file."""
+        config_path = temp_dir / "config.json"
+        config_path.write_text(json.dumps({'settings': {'recursive': False}}), encoding='utf-8')
+        
+        data = ConfigLoader.load_config_file(config_path)
+        
+        assert data == {'settings': {'recursive': False}}
+    
+    def test_missing_file(self, temp_dir):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            ConfigLoader.load_config_file(temp_dir / "missing.yaml")
+    
+    def test_unsupported_format(self, temp_dir):
+        """Test that unsupported extensions are rejected."""
+        config_path = temp_dir / "config.txt"
+        config_path.write_text("settings: {}", encoding='utf-8')
+        
+        with pytest.raises(ValueError, match="Unsupported config file format"):
+            ConfigLoader.load_config_file(config_path)
+    
+    def test_invalid_json(self, temp_dir):
+        """Test that malformed JSON raises ValueError."""
+        config_path = temp_dir / "config.json"
+        config_path.write_text("{not json", encoding='utf-8')
+        
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            ConfigLoader.load_config_file(config_path)
+    
+    def test_invalid_yaml(self, temp_dir):
+        """Test that malformed YAML raises ValueError."""
+        config_path = temp_dir / "config.yaml"
+        config_path.write_text("settings: [unclosed", encoding='utf-8')
+        
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            ConfigLoader.load_config_file(config_path)
+
+
+class TestConfigCache:
+    """Test caching of parsed configuration files."""
+    
+    def test_returned_data_is_independent_copy(self, temp_dir):
+        """Test that mutating loaded data does not affect later loads."""
+        config_path = temp_dir / "config.yaml"
+        config_path.write_text("settings:\n  recursive: true\n", encoding='utf-8')
+        
+        first = ConfigLoader.load_config_file(config_path)
+        first['settings']['recursive'] = False
+        second = ConfigLoader.load_config_file(config_path)
+        
+        assert second['settings']['recursive'] is True
+    
+    def test_modified_file_is_reloaded(self, temp_dir):
+        """Test that editing the file invalidates the cached data."""
+        config_path = temp_dir / "config.yaml"
+        config_path.write_text("settings:\n  recursive: true\n", encoding='utf-8')
+        ConfigLoader.load_config_file(config_path)
+        
+        config_path.write_text("settings:\n  recursive: false\n  preview_mode: true\n", encoding='utf-8')
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        data = ConfigLoader.load_config_file(config_path)
+        
+        assert data == {'settings': {'recursive': False, 'preview_mode': True}}
+
+
+class TestConfigToRenameConfig:
+    """Test converting configuration data to RenameConfig objects."""
+    
+    @pytest.fixture
+    def config_data(self, temp_dir):
+        """Minimal configuration data with a split extractor."""
+        return {
+            'settings': {'input_folder': str(temp_dir), 'recursive': False, 'preview_mode': True},
+            'pipeline': {'extractor': {'name': 'split', 'args': ['_', 'dept', 'type']}}
+        }
+    
+    def test_no_overrides(self, config_data, temp_dir):
+        """Test that file settings are used when no overrides are given."""
+        config = ConfigLoader.config_to_rename_config(config_data)
+        
+        assert config.input_folder == temp_dir
+        assert config.recursive is False
+        assert config.preview_mode is True
+    
+    def test_overrides_applied(self, config_data):
+        """Test that CLI overrides replace file settings."""
+        config = ConfigLoader.config_to_rename_config(
+            config_data,
+            {'input_folder': '/other', 'recursive': True, 'preview_mode': False}
+        )
+        
+        assert config.input_folder == '/other'
+        assert config.recursive is True
+        assert config.preview_mode is False
+    
+    def test_workers_setting_and_override(self, config_data):
+        """Test that workers comes from settings and can be overridden."""
+        config_data['settings']['workers'] = 4
+        
+        assert ConfigLoader.config_to_rename_config(config_data).workers == 4
+        assert ConfigLoader.config_to_rename_config(config_data, {'workers': 2}).workers == 2
+    
+    def test_workers_numeric_string_coerced(self, config_data):
+        """Test that a quoted number in the file is accepted as a worker count."""
+        config_data['settings']['workers'] = "4"
+        
+        assert ConfigLoader.config_to_rename_config(config_data).workers == 4
+    
+    @pytest.mark.parametrize("workers", ["four", None, 0])
+    def test_invalid_workers_setting(self, config_data, workers):
+        """Test that invalid worker settings are rejected instead of failing mid-run."""
+        config_data['settings']['workers'] = workers
+        
+        with pytest.raises(ValueError, match="workers must be an integer >= 1"):
+            ConfigLoader.config_to_rename_config(config_data)
+    
+    def test_empty_input_folder_override_ignored(self, config_data, temp_dir):
+        """Test that an empty input folder override keeps the file setting."""
+        config = ConfigLoader.config_to_rename_config(config_data, {'input_folder': ''})
+        
+        assert config.input_folder == temp_dir
+    
+    def test_execute_disables_preview(self, config_data):
+        """Test that execute overrides preview mode."""
+        config = ConfigLoader.config_to_rename_config(
+            config_data,
+            {'preview_mode': True, 'execute': True}
+        )
+        
+        assert config.preview_mode is False
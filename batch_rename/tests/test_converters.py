@@ -54,6 +54,17 @@ class TestPadNumbersConverter:
         
         assert result['sequence'] == 'abc123def'  # No change for non-numeric
     
+    def test_pad_numbers_first_digit_run(self, extracted_context):
+        """Test that only the first run of digits is padded."""
+        extracted_context.extracted_data['sequence'] = 'v1.2'
+        
+        result = pad_numbers_converter(
+            extracted_context,
+            positional_args=['sequence', '2']
+        )
+        
+        assert result['sequence'] == 'v01.2'
+    
     def test_pad_numbers_missing_field(self, extracted_context):
         """Test padding when field doesn't exist."""
         with pytest.raises(ValueError, match="pad_numbers converter requires field name"):
@@ -130,6 +141,50 @@ class TestDateFormatConverter:
         )
         
         assert result['date'] == ''  # Preserve empty value
+    
+    def test_date_format_compact_input(self, extracted_context):
+        """Test parsing a compact numeric date with single-digit fields."""
+        extracted_context.extracted_data['date'] = '2024115'
+        
+        result = date_format_converter(
+            extracted_context,
+            positional_args=['date', '%Y%m%d', '%Y-%m-%d']
+        )
+        
+        assert result['date'] == '2024-11-05'
+    
+    def test_date_format_impossible_date(self, extracted_context):
+        """Test that out-of-range dates are left unchanged."""
+        extracted_context.extracted_data['date'] = '2024-02-30'
+        
+        result = date_format_converter(
+            extracted_context,
+            positional_args=['date', '%Y-%m-%d', '%m/%d/%Y']
+        )
+        
+        assert result['date'] == '2024-02-30'
+    
+    def test_date_format_mixed_case_literal(self, extracted_context):
+        """Test that literal text matches case-insensitively, as with strptime."""
+        extracted_context.extracted_data['date'] = '2024-01-02t05'
+        
+        result = date_format_converter(
+            extracted_context,
+            positional_args=['date', '%Y-%m-%dT%H', '%Y%m%d_%H']
+        )
+        
+        assert result['date'] == '20240102_05'
+    
+    def test_date_format_named_month_input(self, extracted_context):
+        """Test formats with non-numeric directives."""
+        extracted_context.extracted_data['date'] = 'January 15, 2024'
+        
+        result = date_format_converter(
+            extracted_context,
+            positional_args=['date', '%B %d, %Y', '%Y%m%d']
+        )
+        
+        assert result['date'] == '20240115'
 
 
 class TestCaseConverter:
@@ -4,6 +4,7 @@ Unit tests for custom function loading and validation.
 Tests loading .py files and executing custom extractors, converters, templates, and filters.
 """
 
+import os
 import pytest
 import tempfile
 from pathlib import Path
@@ -81,6 +82,34 @@ def broken_function(
         
         with pytest.raises(ImportError):
             load_custom_function(str(function_file), "broken_function")
+    
+    def test_load_function_reuses_module(self, tmp_path):
+        """Test that loading from an unchanged file does not execute it again."""
+        function_file = tmp_path / "test_functions.py"
+        function_file.write_text("""
+def first(context):
+    return {}
+
+def second(context):
+    return {}
+""")
+        
+        func = load_custom_function(str(function_file), "first")
+        
+        assert load_custom_function(str(function_file), "first") is func
+        assert load_custom_function(str(function_file), "second").__globals__ is func.__globals__
+    
+    def test_load_function_after_file_edit(self, tmp_path):
+        """Test that an edited file is executed again."""
+        function_file = tmp_path / "test_functions.py"
+        function_file.write_text("def version(context):\n    return 1\n")
+        assert load_custom_function(str(function_file), "version")(None) == 1
+        
+        function_file.write_text("def version(context):\n    return 2\n")
+        stat = function_file.stat()
+        os.utime(function_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert load_custom_function(str(function_file), "version")(None) == 2
 
 
 class TestCustomExtractors:
@@ -0,0 +1,65 @@
+"""
+Unit tests for the example scripts in custom_scripts/.
+
+The scripts are loaded by file path, so they cannot share helper modules;
+these tests keep their copied helpers identical.
+"""
+
+import importlib.util
+import inspect
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "custom_scripts"
+
+
+def _load_script(name):
+    """Load a custom script module from its file path."""
+    spec = importlib.util.spec_from_file_location(f"custom_script_{name}", SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def scripts():
+    """The example scripts that carry copied helpers."""
+    return {name: _load_script(name) for name in ("all_in_one", "converters", "extractors")}
+
+
+class TestSharedHelpers:
+    """Test that helpers copied between scripts stay in sync."""
+    
+    def test_parse_yyyymmdd_copies_identical(self, scripts):
+        """Test every copy of _parse_yyyymmdd has the same source."""
+        sources = {inspect.getsource(module._parse_yyyymmdd) for module in scripts.values()}
+        
+        assert len(sources) == 1
+    
+    def test_parse_yyyymmdd_matches_strptime(self, scripts):
+        """Test the helper accepts and rejects the same input as strptime."""
+        parse = scripts["converters"]._parse_yyyymmdd
+        
+        assert parse("20240115") == datetime(2024, 1, 15)
+        assert parse("2024115") == datetime.strptime("2024115", "%Y%m%d")
+        with pytest.raises(ValueError):
+            parse("20240230")
+    
+    def test_parse_client_list_copies_identical(self, scripts):
+        """Test every copy of _parse_client_list has the same source."""
+        sources = {
+            inspect.getsource(scripts[name]._parse_client_list.__wrapped__)
+            for name in ("all_in_one", "extractors")
+        }
+        
+        assert len(sources) == 1
+    
+    def test_parse_client_list_keeps_order_and_spelling(self, scripts):
+        """Test clients keep list order and original spelling alongside the lowercased form."""
+        parse = scripts["extractors"]._parse_client_list
+        
+        assert parse("") == ()
+        assert parse("Acme Corp, beta") == (("Acme Corp", "acme corp"), ("beta", "beta"))
@@ -11,7 +11,9 @@ from core.built_ins.extractors import (
     regex_extractor,
     position_extractor,
     metadata_extractor,
-    BUILTIN_EXTRACTORS
+    build_split_extractor,
+    BUILTIN_EXTRACTORS,
+    BUILTIN_EXTRACTOR_FACTORIES
 )
 from core.step_factory import StepFactory
 from core.steps.base import StepType, StepConfig
@@ -245,6 +247,14 @@ class TestMetadataExtractor:
         assert 'size' in result
         assert result['size'] == '1'  # 1024 bytes = 1 KB
     
+    def test_metadata_size_float_and_negative(self, sample_context):
+        """Test that non-int sizes keep the floor-division formatting."""
+        sample_context.metadata['size'] = 2048.0
+        assert metadata_extractor(sample_context, positional_args=['size'])['size'] == '2.0'
+        
+        sample_context.metadata['size'] = -5
+        assert metadata_extractor(sample_context, positional_args=['size'])['size'] == '0'
+    
     def test_metadata_multiple_fields(self, sample_context):
         """Test extracting multiple metadata fields."""
         result = metadata_extractor(
@@ -309,6 +319,33 @@ class TestExtractorRegistry:
         assert result['type'] == 'employee'
         assert result['category'] == 'data'
     
+    def test_factories_match_registry(self):
+        """Test that every built-in extractor has an argument-parsing factory."""
+        assert set(BUILTIN_EXTRACTOR_FACTORIES) == set(BUILTIN_EXTRACTORS)
+    
+    def test_factory_reused_across_files(self, temp_dir):
+        """Test that a built extractor can be applied to many contexts."""
+        extractor = build_split_extractor(['_', 'dept', 'type'], {})
+        
+        results = [
+            extractor(ProcessingContext(filename=name, file_path=temp_dir / name, metadata={}))
+            for name in ["HR_report.pdf", "IT_logs.txt"]
+        ]
+        
+        assert results == [
+            {'dept': 'HR', 'type': 'report'},
+            {'dept': 'IT', 'type': 'logs'}
+        ]
+    
+    def test_invalid_args_fail_per_file(self, sample_context):
+        """Test that invalid arguments still raise when the extractor runs."""
+        config = StepConfig(name='split', positional_args=[], keyword_args={})
+        
+        extractor_func = StepFactory.create_executable(StepType.EXTRACTOR, config)
+        
+        with pytest.raises(ValueError, match="split extractor requires"):
+            extractor_func(sample_context)
+    
     def test_get_builtin_functions(self):
         """Test getting builtin functions from factory."""
         builtin_funcs = StepFactory.get_builtin_functions(StepType.EXTRACTOR)
@@ -3,6 +3,7 @@ Unit tests for built-in filters and filter functionality.
 """
 
 import pytest
+from datetime import datetime
 from pathlib import Path
 
 from core.built_ins.filters import (
@@ -11,7 +12,10 @@ from core.built_ins.filters import (
     file_size_filter,
     name_length_filter,
     date_modified_filter,
-    BUILTIN_FILTERS
+    build_file_size_filter,
+    BUILTIN_FILTERS,
+    BUILTIN_FILTER_FACTORIES,
+    BUILTIN_FILTER_COSTS
 )
 from core.step_factory import StepFactory
 from core.steps.base import StepType, StepConfig
@@ -76,6 +80,23 @@ class TestPatternFilter:
         )
         
         assert result is True  # Should pass when no patterns
+    
+    @pytest.mark.parametrize("pattern, expected", [
+        ('*.pdf', True),
+        ('*.txt', False),
+        ('HR_*', True),
+        ('IT_*', False),
+        ('HR_employee_data_2024.pdf', True),
+        ('HR_employee_data_2024', False),
+        ('HR_*_2024.pdf', True),
+        ('HR_?mployee*', True),
+        ('[A-Z][A-Z]_*', True),
+    ])
+    def test_pattern_glob_forms(self, sample_context, pattern, expected):
+        """Test literal-only and wildcard glob forms match like fnmatch."""
+        result = pattern_filter(sample_context, positional_args=[pattern])
+        
+        assert result is expected
 
 
 class TestFileTypeFilter:
@@ -305,6 +326,24 @@ class TestDateModifiedFilter:
         )
         
         assert result is False  # No timestamp = False
+    
+    @pytest.mark.parametrize("op_symbol, date_string, expected", [
+        ('>', '2024-02-01', True),
+        ('>', '2024-2-1', True),
+        ('<', '2024-2-1', False),
+        ('==', '2024-02-20', True),
+        ('>', '2024-02-30', True),  # Impossible date, filter disabled
+        ('<', '2024/02/01', True),  # Wrong separator, filter disabled
+    ])
+    def test_date_modified_threshold_forms(self, temp_dir, op_symbol, date_string, expected):
+        """Test the date formats accepted for the threshold."""
+        context = ProcessingContext(
+            filename="test.txt",
+            file_path=temp_dir / "test.txt",
+            metadata={'modified': datetime(2024, 2, 20, 12).timestamp()}
+        )
+        
+        assert date_modified_filter(context, positional_args=[op_symbol, date_string]) is expected
 
 
 class TestFilterRegistry:
@@ -332,6 +371,25 @@ class TestFilterRegistry:
         
         assert result is True
     
+    def test_factories_match_registry(self):
+        """Test that every built-in filter has an argument-parsing factory."""
+        assert set(BUILTIN_FILTER_FACTORIES) == set(BUILTIN_FILTERS)
+    
+    def test_costs_cover_registry(self):
+        """Test that every built-in filter has a cost hint for ordering."""
+        assert set(BUILTIN_FILTER_COSTS) == set(BUILTIN_FILTERS)
+    
+    def test_factory_reused_across_files(self, temp_dir):
+        """Test that a built filter can be applied to many contexts."""
+        size_filter = build_file_size_filter(['100', '1000'], {})
+        
+        results = [
+            size_filter(ProcessingContext(filename="f.txt", file_path=temp_dir / "f.txt", metadata={'size': size}))
+            for size in [50, 500, 5000]
+        ]
+        
+        assert results == [False, True, False]
+    
     def test_get_builtin_functions(self):
         """Test getting builtin functions from factory."""
         builtin_funcs = StepFactory.get_builtin_functions(StepType.FILTER)
@@ -2,6 +2,7 @@
 Unit tests for ProcessingContext class.
 """
 
+import sys
 import pytest
 from pathlib import Path
 
@@ -182,6 +183,20 @@ class TestContextProperties:
         assert context.filename == "file-name_with[special].chars.txt"
         assert context.base_name == "file-name_with[special].chars"
         assert context.extension == ".txt"
+    
+    def test_path_properties_computed_once(self, sample_context):
+        """Test that base name and extension are computed at construction."""
+        base_name = sample_context.base_name
+        extension = sample_context.extension
+        
+        assert sample_context.base_name is base_name
+        assert sample_context.extension is extension
+        assert 'base_name' not in repr(sample_context)
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_context_is_slotted(self, sample_context):
+        """Test that contexts have no per-instance __dict__."""
+        assert not hasattr(sample_context, '__dict__')
 
 
 class TestContextCopying:
@@ -62,6 +62,29 @@ class TestBatchRenameProcessorBasics:
         # Should create an actual change (HR-employee vs HR_employee_data)
         assert len(result.preview_data) == 1
         assert result.preview_data[0]['new_name'] == 'HR-employee.pdf'
+    
+    @pytest.mark.parametrize("recursive", [False, True])
+    def test_file_list_matches_glob(self, temp_dir, recursive):
+        """Test that the folder scan finds the same files, in the same order, as Path.glob."""
+        (temp_dir / "top_1.txt").write_text("content")
+        (temp_dir / "sub" / "deeper").mkdir(parents=True)
+        (temp_dir / "sub" / "mid_2.txt").write_text("content")
+        (temp_dir / "sub" / "deeper" / "low_3.txt").write_text("content")
+        (temp_dir / "other").mkdir()
+        (temp_dir / "other" / "side_4.txt").write_text("content")
+        
+        config = RenameConfig(
+            input_folder=temp_dir,
+            extractor="split",
+            extractor_args={'positional': ['_', 'name', 'num'], 'keyword': {}},
+            recursive=recursive
+        )
+        
+        entries = BatchRenameProcessor()._get_file_list(config)
+        
+        pattern = "**/*" if recursive else "*"
+        assert [entry.path for entry in entries] == [p for p in temp_dir.glob(pattern) if p.is_file()]
+        assert all(entry.stat.st_size == len("content") for entry in entries)
 
 
 class TestFileFiltering:
@@ -130,6 +153,43 @@ class TestFileFiltering:
         # Should only process non-PDF files
         assert len(result.preview_data) == 1
         assert result.preview_data[0]['old_name'] == 'doc_2.txt'
+    
+    def test_builtin_filters_run_before_custom(self, temp_dir):
+        """Test that cheap built-in filters reject files before custom filters see them."""
+        files_dir = temp_dir / "files"
+        files_dir.mkdir()
+        (files_dir / "doc_1.pdf").write_text("content")
+        (files_dir / "doc_2.txt").write_text("content")
+        
+        seen_log = temp_dir / "seen.log"
+        filter_file = temp_dir / "logging_filter.py"
+        filter_file.write_text(f'''
+def log_filter(context):
+    with open({str(seen_log)!r}, 'a') as f:
+        f.write(context.filename + "\\n")
+    return True
+''')
+        
+        config = RenameConfig(
+            input_folder=files_dir,
+            extractor="split",
+            extractor_args={'positional': ['_', 'prefix', 'num'], 'keyword': {}},
+            filters=[
+                {'name': str(filter_file), 'positional': ['log_filter'], 'keyword': {}, 'inverted': False},
+                {'name': 'file-type', 'positional': ['pdf'], 'keyword': {}, 'inverted': False},
+            ],
+            template={
+                'name': 'join',
+                'positional': ['prefix', 'num'],
+                'keyword': {'separator': '_MODIFIED_'}
+            },
+            preview_mode=True
+        )
+        
+        result = BatchRenameProcessor().process(config)
+        
+        assert [f['old_name'] for f in result.preview_data] == ['doc_1.pdf']
+        assert seen_log.read_text().split() == ['doc_1.pdf']
 
 
 class TestDataExtraction:
@@ -586,4 +646,29 @@ class TestPerformanceMetrics:
         assert result.files_found == 1
         assert len(result.preview_data) == 0  # No successful extractions
         # Errors might be 0 if extraction failure is handled as "no match" rather than error
-        assert result.errors >= 0
\ No newline at end of file
+        assert result.errors >= 0
+    
+    def test_thread_pool_matches_serial(self, temp_dir):
+        """Test that planning files on worker threads gives the serial result."""
+        for i in range(20):
+            (temp_dir / f"doc_{i}.pdf").write_text("content")
+        (temp_dir / "nounderscore.pdf").write_text("content")
+        
+        def run(workers):
+            config = RenameConfig(
+                input_folder=temp_dir,
+                extractor="split",
+                extractor_args={'positional': ['_', 'prefix', 'num'], 'keyword': {}},
+                converters=[{'name': 'pad_numbers', 'positional': ['num', '3'], 'keyword': {}}],
+                template={'name': 'template', 'positional': ['{prefix}-{num}'], 'keyword': {}},
+                preview_mode=True,
+                workers=workers
+            )
+            return BatchRenameProcessor().process(config)
+        
+        serial = run(1)
+        threaded = run(4)
+        
+        assert threaded.preview_data == serial.preview_data
+        assert threaded.error_details == serial.error_details
+        assert len(threaded.preview_data) == 21
@@ -2,6 +2,7 @@
 Unit tests for StepFactory and step management functionality.
 """
 
+import dataclasses
 import pytest
 from pathlib import Path
 
@@ -54,6 +55,14 @@ class TestStepFactoryBasics:
         assert StepType.CONVERTER in step_types
         assert StepType.FILTER in step_types
         assert StepType.TEMPLATE in step_types
+    
+    def test_help_text_rendered_once(self):
+        """Test that help text is cached per step class."""
+        step = StepFactory.get_step(StepType.FILTER)
+        help_text = step.get_help_text()
+        
+        assert step.get_help_text() is help_text
+        assert all(name in help_text for name in step.builtin_functions)
 
 
 class TestExecutableCreation:
@@ -195,6 +204,14 @@ class TestBuiltinFunctionAccess:
         
         # But with same content
         assert funcs1.keys() == funcs2.keys()
+    
+    def test_step_builtin_functions_read_only(self):
+        """Test that steps share a read-only view of their built-ins."""
+        step = StepFactory.get_step(StepType.EXTRACTOR)
+        
+        assert step.builtin_functions is step.builtin_functions
+        with pytest.raises(TypeError):
+            step.builtin_functions['new'] = lambda context: {}
 
 
 class TestCustomFunctionValidation:
@@ -245,6 +262,34 @@ class TestCustomFunctionValidation:
         result = StepFactory.validate_custom_function(StepType.FILTER, invalid_func)
         assert result.valid is False
         assert 'parameter' in result.message.lower()
+    
+    def test_validate_callable_without_weakref_support(self):
+        """Test validating callables whose signature cannot be cached."""
+        class SlottedFilter:
+            __slots__ = ()
+            __name__ = 'slotted_filter'
+            
+            def __call__(self, context):
+                return True
+        
+        result = StepFactory.validate_custom_function(StepType.FILTER, SlottedFilter())
+        assert result.valid is True
+    
+    def test_validate_callable_object_without_name(self):
+        """Test that callable objects are named by their class."""
+        class SuffixFilter:
+            def __call__(self, context):
+                return True
+        
+        result = StepFactory.validate_custom_function(StepType.FILTER, SuffixFilter())
+        assert result.valid is True
+        assert 'SuffixFilter()' in result.message
+    
+    def test_validate_uninspectable_callable(self):
+        """Test that callables without a signature are reported as invalid."""
+        result = StepFactory.validate_custom_function(StepType.FILTER, 42)
+        assert result.valid is False
+        assert 'Error inspecting filter function' in result.message
 
 
 class TestCustomFunctionLoading:
@@ -289,6 +334,25 @@ class TestCustomFunctionLoading:
         assert result['converted'] == 'TRUE'  # Added by test_converter
         assert result['dept'] == 'HR'         # Uppercased by test_converter
         assert result['type'] == 'EMPLOYEE'   # Uppercased by test_converter
+    
+    def test_custom_function_validated_once(self, custom_converter_file, monkeypatch):
+        """Test that rebuilding a custom step reuses its validation."""
+        step = StepFactory.get_step(StepType.CONVERTER)
+        calls = []
+        original_validate = step.validate_custom_function
+        monkeypatch.setattr(step, 'validate_custom_function',
+                            lambda function: calls.append(function) or original_validate(function))
+        
+        config = StepConfig(
+            name=str(custom_converter_file),
+            positional_args=['test_converter'],
+            keyword_args={}
+        )
+        
+        StepFactory.create_executable(StepType.CONVERTER, config)
+        StepFactory.create_executable(StepType.CONVERTER, config)
+        
+        assert len(calls) == 1
 
 
 class TestStepConfigValidation:
@@ -330,6 +394,30 @@ class TestStepConfigValidation:
         assert config.name == 'test_function'
         assert config.positional_args == []
         assert config.keyword_args == {}
+    
+    def test_step_config_is_frozen(self):
+        """Test that step configuration cannot be reassigned after creation."""
+        config = StepConfig(name='split', positional_args=['_'], keyword_args={})
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.name = 'regex'
+    
+    def test_step_config_rejects_positional_args_keyword(self):
+        """Test that 'positional_args' cannot be passed as a keyword argument."""
+        with pytest.raises(ValueError, match="'positional_args' cannot be used"):
+            StepConfig(name='split', positional_args=['_'], keyword_args={'positional_args': ['x']})
+    
+    def test_factory_bug_not_swallowed(self, monkeypatch):
+        """Test that unexpected factory errors propagate instead of silently falling back."""
+        def broken_factory(positional_args, kwargs):
+            raise RuntimeError("factory bug")
+        
+        step = StepFactory.get_step(StepType.EXTRACTOR)
+        monkeypatch.setitem(step.builtin_factories, 'split', broken_factory)
+        config = StepConfig(name='split', positional_args=['_', 'dept'], keyword_args={})
+        
+        with pytest.raises(RuntimeError, match="factory bug"):
+            StepFactory.create_executable(StepType.EXTRACTOR, config)
 
 
 class TestStepExecutionOrder:
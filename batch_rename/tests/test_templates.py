@@ -6,6 +6,7 @@ import pytest
 
 from core.step_factory import StepFactory
 from core.steps.base import StepType, StepConfig
+from core.built_ins.templates import BUILTIN_TEMPLATES, BUILTIN_TEMPLATE_FACTORIES
 
 
 class TestStringSmithTemplate:
@@ -150,6 +151,18 @@ class TestTemplateRegistry:
         assert 'template' in builtin_funcs
         assert 'stringsmith' in builtin_funcs
         assert 'join' in builtin_funcs
+    
+    def test_factories_are_builtin_templates(self):
+        """Test that every template factory belongs to a registered template."""
+        assert set(BUILTIN_TEMPLATE_FACTORIES) <= set(BUILTIN_TEMPLATES)
+    
+    def test_stringsmith_reused_across_files(self, extracted_context):
+        """Test that one built StringSmith template formats many contexts."""
+        template = BUILTIN_TEMPLATE_FACTORIES['stringsmith'](['{{dept}}_{{year}}'], {})
+        
+        assert template(extracted_context) == 'HR_2024'
+        extracted_context.extracted_data = {'dept': 'IT', 'year': '2025'}
+        assert template(extracted_context) == 'IT_2025'
 
 
 class TestCustomTemplateLoading:
@@ -255,6 +268,32 @@ class TestTemplateEdgeCases:
         result = template_func(extracted_context)
         
         assert result == 'HR-test-file_v1.2'
+    
+    def test_template_missing_field_renders_empty(self, extracted_context):
+        """Test that fields absent from the data render as empty strings."""
+        config = StepConfig(
+            name='template',
+            positional_args=['{dept}_{missing}'],
+            keyword_args={}
+        )
+        
+        template_func = StepFactory.create_executable(StepType.TEMPLATE, config)
+        
+        assert template_func(extracted_context) == 'HR_'
+    
+    def test_template_missing_field_keeps_format_spec(self, extracted_context):
+        """Test that present fields keep their format spec when another field is missing."""
+        extracted_context.extracted_data['num'] = 7
+        
+        config = StepConfig(
+            name='template',
+            positional_args=['{num:03d}_{dept!r}_{missing}'],
+            keyword_args={}
+        )
+        
+        template_func = StepFactory.create_executable(StepType.TEMPLATE, config)
+        
+        assert template_func(extracted_context) == "007_'HR'_"
 
 
 class TestTemplateIntegration:
@@ -15,6 +15,17 @@ from ..core.processor import BatchRenameProcessor
 from ..core.config import RenameConfig
 
 
+def _positive_int(value: str) -> int:
+    """Argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_function_call(call_string: str) -> Tuple[str, List[str], Dict[str, Any], bool]:
     """
     Parse function call string into components.
@@ -123,6 +134,7 @@ def create_config_from_cli_args(args) -> RenameConfig:
         filters=filters,
         recursive=args.recursive,
         preview_mode=args.preview and not args.execute,
+        workers=1 if args.workers is None else args.workers,
         on_existing_collision=args.on_existing_collision,
         on_internal_collision=args.on_internal_collision
     )
@@ -142,6 +154,8 @@ def create_config_from_file(args) -> RenameConfig:
         cli_overrides['execute'] = args.execute
     if hasattr(args, 'preview') and args.preview:
         cli_overrides['preview_mode'] = True
+    if hasattr(args, 'workers') and args.workers is not None:
+        cli_overrides['workers'] = args.workers
     
     # Load configuration from file
     config = ConfigLoader.load_rename_config(args.config, cli_overrides)
@@ -209,6 +223,8 @@ Examples:
                                 help='Show preview of changes (default)')
     execution_group.add_argument('--execute', action='store_true',
                                 help='Execute the rename operations (overrides --preview)')
+    execution_group.add_argument('--workers', type=_positive_int,
+                                help='Threads used to plan renames (default: 1); custom functions must be thread-safe')
     
     # Collision handling
     collision_group = parser.add_argument_group('Collision Handling')